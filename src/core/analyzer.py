@@ -11,6 +11,12 @@ from typing import Dict, Tuple, List, Union
 from dataclasses import dataclass
 from src.core.calibration import CalibrationAgent
 
+# Source patterns that raise the memory estimate, compiled once at import
+_LARGE_LIST_RE = re.compile(r'\[.*\].*\*\s*[0-9]{4,}')
+_DICT_RE = re.compile(r'dict\(|{.*:.*}')
+_FILE_READ_RE = re.compile(r'\.read\(\)|\.readlines\(\)')
+_DATA_SCIENCE_RE = re.compile(r'DataFrame|numpy|np\.array')
+
 
 @dataclass
 class ComplexityMetrics:
@@ -248,16 +254,16 @@ class EmissionAnalyzer:
         memory_mb = 10.0  # Base memory
         
         # Check for large data structures
-        if re.search(r'\[.*\].*\*\s*[0-9]{4,}', content):
+        if _LARGE_LIST_RE.search(content):
             memory_mb += 100  # Large lists
         
-        if re.search(r'dict\(|{.*:.*}', content):
+        if _DICT_RE.search(content):
             memory_mb += 50  # Dictionaries
         
-        if re.search(r'\.read\(\)|\.readlines\(\)', content):
+        if _FILE_READ_RE.search(content):
             memory_mb += 200  # File reading
         
-        if re.search(r'DataFrame|numpy|np\.array', content):
+        if _DATA_SCIENCE_RE.search(content):
             memory_mb += 500  # Data science libraries
         
         return memory_mb
@@ -5,411 +5,768 @@ This module implements AST-based and pattern-based detection methods for each ru
 """
 
 import ast
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Tuple
-
-from tree_sitter import Language, Parser, Query, QueryCursor
+import sqlite3
+import sys
+import threading
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from tree_sitter import Language, Parser, Query, QueryCursor, Tree
 import tree_sitter_javascript
 from src.utils.logger import logger
 
 
-class JavaScriptASTDetector:
-    """AST-based detector for JavaScript using Tree-sitter."""
+def _detectors_fingerprint() -> bytes:
+    """Digest of this module's source, the Python version and the parser versions."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    # ast and Tree-sitter output can change between releases, and with them
+    # what the same source produces
+    digest.update(b'python %d.%d\0' % sys.version_info[:2])
+    for dist in ('tree-sitter', 'tree-sitter-javascript'):
+        try:
+            version = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            version = 'unknown'
+        digest.update(f'{dist} {version}\0'.encode('ascii', 'replace'))
+    return digest.digest()
+
+
+# Mixed into analysis cache keys so cached results are invalidated whenever
+# detection logic or the interpreter and parsers it runs on change.
+_DETECTORS_FINGERPRINT = _detectors_fingerprint()
+
+
+# Violation templates for PythonViolationDetector: (id, severity, pattern_match, message).
+# Only the line (and the message, where it is None here) varies per emission.
+_TMPL_NESTED_FOR_LOOP_MAJOR = ('no_n2_algorithms', 'major', 'nested_for_loop', None)
+_TMPL_NESTED_FOR_LOOP_CRITICAL = ('no_n2_algorithms', 'critical', 'nested_for_loop', None)
+_TMPL_RANGE_LEN = ('inefficient_loop', 'major', 'range_len', 'Using range(len(sequence)) is inefficient. Use enumerate() or zip().')
+_TMPL_DICT_KEYS_ITER = ('inefficient_dictionary_iteration', 'minor', 'dict_keys_iter', 'Iterating over .keys() is redundant. Iterate over the dictionary directly.')
+_TMPL_INFINITE_WHILE = ('no_infinite_loops', 'critical', 'infinite_while', 'Infinite loop detected (while True). Ensure break condition exists.')
+_TMPL_NESTED_WHILE_LOOP = ('excessive_nesting_depth', 'critical', 'nested_while_loop', None)
+_TMPL_IO_OPERATION_IN_LOOP = ('io_in_loop', 'critical', 'io_operation_in_loop', None)
+_TMPL_COMPUTATION_OUTSIDE_LOOP = ('unnecessary_computation', 'critical', 'computation_outside_loop', None)
+_TMPL_LIST_LOOKUP_LOOP = ('inefficient_lookup', 'medium', 'list_lookup_loop', None)
+_TMPL_STRING_CONCAT_LOOP = ('string_concatenation_in_loop', 'medium', 'string_concat_loop', 'String concatenation in loop creates O(n²) memory allocations. Use list.append() and "".join().')
+_TMPL_SYNC_IO = ('blocking_io', 'high', 'sync_io', None)
+_TMPL_FILE_NOT_CLOSED = ('proper_resource_cleanup', 'high', 'file_not_closed', 'File opened without context manager. Use "with open()" to ensure closure.')
+_TMPL_PRINT_USAGE = ('excessive_logging', 'minor', 'print_usage', 'Usage of "print" detected. Use logging module or remove in production.')
+_TMPL_LOGGING_CALL = ('excessive_logging', 'minor', 'logging_call', None)
+_TMPL_DEEPCOPY = ('heavy_object_copy', 'major', 'deepcopy', 'Usage of deepcopy detected. This is computationally expensive.')
+_TMPL_PROCESS_SPAWN = ('process_spawning', 'critical', 'process_spawn', 'Process spawning detected. High OS overhead.')
+_TMPL_READLINES = ('inefficient_file_read', 'major', 'readlines', 'Using readlines() reads entire file into memory. Iterate file object instead.')
+_TMPL_ITERROWS = ('pandas_iterrows', 'major', 'iterrows', 'Using iterrows() is slow. Use vectorization or apply().')
+_TMPL_ANY_ALL_LIST_COMP = ('any_all_list_comprehension', 'major', 'any_all_list_comp', None)
+_TMPL_GENERATOR_LIST_COMP = ('unnecessary_generator_list', 'minor', 'generator_list_comp', None)
+_TMPL_EAGER_LOGGING = ('eager_logging_formatting', 'minor', 'eager_logging', 'Using f-string in logging. Use lazy formatting (e.g. logger.info("%s", val)) to avoid unnecessary string interpolation.')
+_TMPL_GLOBAL_KEYWORD = ('global_variable_mutation', 'minor', 'global_keyword', 'Global variable usage detected. Can hinder optimization.')
+_TMPL_TRY_IN_LOOP = ('exceptions_in_loop', 'major', 'try_in_loop', 'Try/Except block inside loop. Exception handling is expensive.')
+_TMPL_BARE_EXCEPT = ('bare_except', 'major', 'bare_except', 'Bare except clause detected. Catch specific exceptions.')
+_TMPL_COMPLEX_FUNCTION = ('high_cyclomatic_complexity', 'medium', 'complex_function', None)
+_TMPL_RECURSIVE_FUNCTION = ('deep_recursion', 'major', 'recursive_function', None)
+_TMPL_MUTABLE_DEFAULT = ('mutable_default_argument', 'major', 'mutable_default', 'Mutable default argument detected. Use None and initialize inside function.')
+_TMPL_MAGIC_NUMBER = ('magic_numbers', 'minor', 'magic_number', None)
+_TMPL_UNUSED_VAR = ('unused_variables', 'medium', 'unused_var', None)
+_TMPL_UNUSED_IMPORT = ('unused_imports', 'low', 'unused_import', None)
+
+# Call names checked by PythonViolationDetector
+_IO_PATTERNS = frozenset({'open', 'read', 'write', 'requests', 'urlopen'})
+_REDUNDANT_FUNCS = frozenset({'len', 'range', 're.compile', 'datetime.now', 'time.time'})
+# _REDUNDANT_FUNCS split by call shape: bare names, and (module, attr) pairs
+# so qualified calls are checked without formatting a dotted name
+_REDUNDANT_NAMES = frozenset(name for name in _REDUNDANT_FUNCS if '.' not in name)
+_REDUNDANT_ATTRS = frozenset(tuple(name.split('.')) for name in _REDUNDANT_FUNCS if '.' in name)
+_BLOCKING_IO = frozenset({'requests.get', 'urlopen', 'time.sleep'})
+# Statements that add a path to a function's cyclomatic complexity
+_BRANCH_TYPES = (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With)
+# Definitions with their own complexity, not counted toward an enclosing function
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+# ("module", "attr") pairs of the dotted _BLOCKING_IO entries
+_BLOCKING_ATTRS = frozenset(tuple(name.split('.')) for name in _BLOCKING_IO if '.' in name)
+# Receivers whose debug/info/... calls count as logging
+_LOGGER_NAMES = frozenset({'logger', 'logging'})
+# <module>.<attr>(...) calls that spawn a process, by module
+_PROCESS_CALLS = {
+    'subprocess': frozenset({'run', 'Popen', 'call', 'check_call', 'check_output', 'getoutput', 'getstatusoutput'}),
+    'os': frozenset({'system', 'popen', 'spawnl', 'spawnle', 'spawnlp', 'spawnlpe', 'spawnv', 'spawnve',
+                     'spawnvp', 'spawnvpe', 'posix_spawn', 'posix_spawnp'}),
+}
+# Attributes that spawn a process whatever they are called on, e.g. the
+# subprocess.Popen wrappers in asyncio.windows_utils
+_ANY_RECEIVER_PROCESS_ATTRS = frozenset({'Popen'})
+_PROCESS_ATTRS = frozenset().union(*_PROCESS_CALLS.values())
+# Common constants that are not reported as magic numbers
+_MAGIC_NUMBER_EXEMPT = frozenset({1000, 1024, 60, 3600})
+# Constructors whose result is tracked as an efficient (hashed) container
+_EFFICIENT_CONTAINER_FUNCS = frozenset({'set', 'dict'})
+
+# Violation dict templates for JavaScriptASTDetector, copied per emission with
+# only the line (and, where it is None here, the message) filled in. Keys are
+# in the usual violation order so copies serialize the same way.
+def _js_template(rule_id: str, severity: str, pattern_match: str, message: Optional[str] = None) -> Dict:
+    return {'id': rule_id, 'line': 0, 'severity': severity, 'message': message, 'pattern_match': pattern_match}
+
+
+_JS_TMPL_MAGIC_NUMBER = _js_template('magic_numbers', 'minor', 'magic_number_js')
+_JS_TMPL_NESTED_LOOP_MAJOR = _js_template('no_n2_algorithms', 'major', 'nested_loop_js')
+_JS_TMPL_NESTED_LOOP_CRITICAL = _js_template('no_n2_algorithms', 'critical', 'nested_loop_js')
+_JS_TMPL_DOM_IN_LOOP = _js_template('unnecessary_dom_manipulation', 'critical', 'dom_in_loop')
+_JS_TMPL_STRING_CONCAT = _js_template('string_concatenation', 'major', 'string_concat_js',
+                                      'String concatenation in loop creates new objects repeatedly.')
+
+# Tree-sitter node types that open a JavaScript loop
+_LOOP_TYPES = frozenset({'for_statement', 'while_statement', 'do_statement', 'for_in_statement', 'for_of_statement'})
+
+# Well-known JavaScript numeric constants that are not reported as magic numbers
+_JS_MAGIC_NUMBER_EXEMPT = frozenset({1000, 1024, 3600})
+# Literal source bytes that can never be reported: integers below the
+# threshold (by far the most common literals) and the exempt constants
+_JS_MAGIC_NUMBER_SKIP_BYTES = frozenset(
+    str(n).encode('ascii') for n in (*range(100), *_JS_MAGIC_NUMBER_EXEMPT)
+)
+
+# At least one of these appears in anything a JavaScriptASTDetector rule can
+# match: a call or loop parenthesis, a tagged-template call, a numeric
+# literal, an import statement or a new expression
+_JS_AST_SIGIL_RE = re.compile(r'[(`0-9]|\bimport\b|\bnew\b')
+
+# DOM members that trigger reflow when touched inside a loop, as one anchored
+# alternation for the Tree-sitter #match? predicate
+_JS_DOM_METHODS = ("appendChild", "innerHTML", "textContent", "setAttribute", "classList", "write")
+_JS_DOM_METHODS_REGEX = "^(" + "|".join(map(re.escape, _JS_DOM_METHODS)) + ")$"
+
+# JavaScript tokenizer for JavaScriptViolationDetector: a comment, quoted
+# string or regex literal to skip, a declaration ("let|const|var name =" on
+# one line, stopping before the "=" so a regex literal after it is still
+# recognised) or any other word, in one scan. Skipped spans are consumed
+# whole, so words inside them never count as declarations or uses. Template
+# literal text is blanked out beforehand by _blank_js_template_text, leaving
+# only its ${...} substitutions (which do reference variables) as code.
+# It runs over the UTF-8 bytes of the source; bytes >= 0x80 count as word
+# characters so non-ASCII identifiers stay whole. Word boundaries are implied:
+# finditer consumes each word entirely, so a match never starts mid-word.
+_JS_WORD = rb'[\w\x80-\xff]+'
+_JS_SKIP = rb'//[^\n]*|/\*(?s:.*?)\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+# A regex literal, recognised by the operator or opening bracket before it
+# (where a "/" cannot be division), so a quote or backtick inside it is inert
+_JS_SKIP += rb'|[(,=:\[!&|?;][^\S\n]*/(?![/*])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/'
+_JS_DECL_HEAD = rb'(?:let|const|var)[^\S\n]+'
+_JS_TOKEN_RE = re.compile(
+    rb'(?P<skip>' + _JS_SKIP + rb')'
+    rb'|(?P<decl>' + _JS_DECL_HEAD + rb'(?P<name>' + _JS_WORD + rb')(?=[^\S\n]*=))|(?P<word>' + _JS_WORD + rb')'
+)
+# The same tokens shaped for findall(): (declared name, word) per token, with
+# skipped comments/strings as (b'', b''), so a Counter can tally them in C
+_JS_TOKEN_COUNT_RE = re.compile(
+    rb'(?:' + _JS_SKIP + rb')'
+    rb'|' + _JS_DECL_HEAD + rb'(' + _JS_WORD + rb')(?=[^\S\n]*=)|(' + _JS_WORD + rb')'
+)
+
+# Template-literal state machine for _blank_js_template_text. In code, stop at
+# anything that changes state: a comment, quoted string or regex literal
+# (skipped whole so a backtick or brace inside it is ignored), a backtick, or
+# a brace. In template text, run to the closing backtick or the next "${".
+_JS_CODE_STOP_RE = re.compile(rb'(?:' + _JS_SKIP + rb')|[`{}]')
+_JS_TEMPLATE_TEXT_RE = re.compile(rb'(?:[^`\\$]+|\\(?s:.)|\$(?!\{))*')
+_JS_NON_NEWLINE_RE = re.compile(rb'[^\n]')
+
+
+def _blank_js_template_text(raw: bytes) -> bytes:
+    """
+    Return raw with the text of every template literal (backticks included)
+    replaced by spaces, keeping newlines and ${...} substitutions, nested
+    braces and templates included, as code. Offsets and line numbers are
+    unchanged, so the result can stand in for raw when tokenizing.
+    """
+    if b'`' not in raw:
+        return raw
+    out = bytearray(raw)
+    end = len(raw)
+    # Open brace count of each enclosing ${...}, innermost last
+    depths = []
+    pos = 0
+    while pos < end:
+        match = _JS_CODE_STOP_RE.search(raw, pos)
+        if match is None:
+            break
+        token = match.group()
+        if token == b'{':
+            if depths:
+                depths[-1] += 1
+            pos = match.end()
+            continue
+        if token == b'}' and depths and depths[-1]:
+            depths[-1] -= 1
+            pos = match.end()
+            continue
+        if token == b'`' or (token == b'}' and depths):
+            if token == b'}':
+                # The brace closing a ${...} resumes its template's text
+                depths.pop()
+            start = match.start()
+            text_end = _JS_TEMPLATE_TEXT_RE.match(raw, start + 1).end()
+            if raw.startswith(b'${', text_end):
+                depths.append(0)
+                pos = text_end + 2
+            else:
+                pos = min(text_end + 1, end)
+            out[start:pos] = _JS_NON_NEWLINE_RE.sub(b' ', raw[start:pos])
+            continue
+        # Comment, quoted string, or a stray closing brace
+        pos = match.end()
+    return bytes(out)
+
+
+# Patterns for PatternBasedDetector, compiled once at import. They are run over
+# the whole buffer, so whitespace classes exclude newlines ([^\S\n]) to keep
+# every match on a single line.
+
+# One pass for all redundant-computation kinds: a "for x in" header up to its
+# first colon, then one optional lookahead per call kind over the rest of the
+# line, so each call kind is reported once per line (a line with both len()
+# and .count() reports both)
+_REDUNDANT_COMPUTATION_RE = re.compile(
+    r'for[^\S\n]+\w+[^\S\n]+in[^\S\n]+[^\n]*?:'
+    r'(?=[^\n]*(?P<len>len\())?'
+    r'(?=[^\n]*(?P<count>\.count\())?'
+    r'(?=[^\n]*(?P<compile>re\.compile\())?'
+)
+# (group in _REDUNDANT_COMPUTATION_RE, description), in reporting order
+_REDUNDANT_COMPUTATION_KINDS = (
+    ('len', 'len() in loop'),
+    ('count', '.count() in loop'),
+    ('compile', 're.compile() in loop'),
+)
+# (pattern, literal, message), where literal is a substring every match
+# contains so files without it skip the regex scan entirely
+_INEFFICIENT_DATA_STRUCTURE_PATTERNS = (
+    (re.compile(r'\.index\([^)\n]*\)[^\S\n]*[!=]='), '.index(', '.index() for lookup (O(n)), use set'),
+    (re.compile(r'\.count\([^)\n]*\)'), '.count(', '.count() for membership test (O(n)), use set'),
+)
+_RE_PY_FOR = re.compile(r'\bfor\b')
+_RE_DEDENT = re.compile(r'^(?!\s)')
+_RE_STR_CONCAT = re.compile(r'\+=\s*["\']')
+# "return" / "raise" anywhere; callers check that only indentation precedes it
+_RE_RETURN_OR_RAISE = re.compile(r'r(?:eturn|aise)')
+_RE_NEWLINE = re.compile('\n')
+# Statements that legitimately follow a return/raise line
+_DEAD_CODE_EXEMPT_PREFIXES = ('except', 'finally', 'elif', 'else', '@', 'def', 'class')
+
+
+class ViolationCache:
+    """
+    Persistent per-file detection results, stored in a SQLite database.
 
-    def __init__(self, content: str, file_path: str):
-        self.content = content
-        self.file_path = file_path
-        self.violations = []
-        self.tree = None
-        self.language = None
+    Entries are keyed on a SHA-256 of the detector source (plus the Python
+    and parser versions), the detector namespace and the file content (not
+    its path), so rule changes invalidate old results. Every database error
+    is treated as a miss: the cache can only save work, never fail a scan.
+
+    The database lives at DB_PATH unless the GREEN_AI_CACHE_DB environment
+    variable names another file; being in the environment, that choice also
+    reaches spawned scan workers.
+    """
 
+    DB_PATH = Path.home() / ".green-ai" / "cache" / "violations.db"
+    ENV_VAR = 'GREEN_AI_CACHE_DB'
+
+    # One connection per thread (and per process, as workers are spawned)
+    _local = threading.local()
+
+    @classmethod
+    def key(cls, namespace: str, content: str) -> bytes:
+        """Cache key for content analysed by the given detector namespace."""
+        digest = hashlib.sha256(_DETECTORS_FINGERPRINT)
+        digest.update(namespace.encode('ascii') + b'\0')
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+
+    @classmethod
+    def db_path(cls) -> Path:
+        """Location of the database: $GREEN_AI_CACHE_DB, else DB_PATH."""
+        override = os.environ.get(cls.ENV_VAR)
+        return Path(override) if override else cls.DB_PATH
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        """Open (or reuse) this thread's connection to the database."""
+        local = cls._local
+        db_path = cls.db_path()
+        if getattr(local, 'path', None) != db_path:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), timeout=5, isolation_level=None)
+            # WAL lets parallel scan workers read while one of them writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS violations (key BLOB PRIMARY KEY, data TEXT NOT NULL)')
+            local.conn, local.path = conn, db_path
+        return local.conn
+
+    @classmethod
+    def get(cls, key: bytes) -> Optional[List[Dict]]:
+        """Cached violations for key, or None on a miss or unreadable entry."""
         try:
-            self.language = Language(tree_sitter_javascript.language())
-            self.parser = Parser(self.language)
-            self.tree = self.parser.parse(bytes(self.content, "utf8"))
-        except Exception as e:
-            # Fallback or log error
-            logger.error(f"Error initializing Tree-sitter for {file_path}: {e}")
+            row = cls._connect().execute('SELECT data FROM violations WHERE key = ?', (key,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Analysis cache read failed: {e}")
+            return None
+
+    @classmethod
+    def put(cls, key: bytes, violations: List[Dict]) -> None:
+        """Store violations for key; failures only cost a re-scan."""
+        try:
+            cls._connect().execute('INSERT OR REPLACE INTO violations (key, data) VALUES (?, ?)',
+                                   (key, json.dumps(violations)))
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Analysis cache write failed: {e}")
 
-    def detect_all(self) -> List[Dict]:
-        """Run all AST-based detectors."""
-        if not self.tree:
-            return []
-
-        self._detect_excessive_logging()
-        self._detect_eval()
-        self._detect_magic_numbers()
-        self._detect_deprecated_apis()
-        self._detect_inefficient_browser_apis()
-        self._detect_sync_io()
-        self._detect_loops()
-        self._detect_dom_manipulation()
-        self._detect_string_concatenation()
 
-        return self.violations
+def _common_prefix_len(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of a and b, by binary search over slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _byte_point(source: bytes, offset: int) -> Tuple[int, int]:
+    """Tree-sitter (row, byte column) of a byte offset in source."""
+    return source.count(b'\n', 0, offset), offset - (source.rfind(b'\n', 0, offset) + 1)
+
 
-    def _detect_excessive_logging(self) -> None:
-        """Detect console.log usage."""
-        query_scm = """
+class JavaScriptASTDetector:
+    """AST-based detector for JavaScript using Tree-sitter."""
+
+    LOOP_TYPES = _LOOP_TYPES
+
+    # Shared across instances: the grammar is loaded and each query compiled
+    # once per process instead of once per file
+    _LANGUAGE: Optional[Language] = None
+    _COMPILED_QUERIES: Dict[str, Query] = {}
+
+    # file_path -> (source bytes, tree) of the last parse, so re-scans of an
+    # edited file can reparse incrementally from the previous tree
+    _TREE_CACHE_SIZE = 64
+    _TREE_CACHE: "OrderedDict[str, Tuple[bytes, Tree]]" = OrderedDict()
+
+    # Every rule as (query pattern, handler). The patterns are compiled into a
+    # single Tree-sitter query so each tree is traversed once, and a match's
+    # pattern index selects its handler. A handler is either
+    # (rule_id, severity, message, pattern_match), reported once per line at
+    # the first capture, or the name of a method taking the match captures.
+    # Each entry must hold exactly one top-level pattern.
+    RULES = (
+        # console.log / debug / info
+        ("""
         (call_expression
           function: (member_expression
             object: (identifier) @obj
             property: (property_identifier) @prop)
           (#eq? @obj "console")
           (#match? @prop "^(log|debug|info)$"))
-        """
-        self._run_query(query_scm, 'excessive_console_logging', 'minor',
-                       'Console logging detected. Remove in production.', 'console_log')
-
-    def _detect_eval(self) -> None:
-        """Detect eval usage."""
-        query_scm = """
+        """, ('excessive_console_logging', 'minor',
+              'Console logging detected. Remove in production.', 'console_log')),
+        # eval()
+        ("""
         (call_expression
           function: (identifier) @func
           (#eq? @func "eval"))
-        """
-        self._run_query(query_scm, 'eval_usage', 'critical',
-                       'Eval is a security risk and slow.', 'eval_usage')
-
-    def _detect_magic_numbers(self) -> None:
-        """Detect magic numbers."""
-        query_scm = """
+        """, ('eval_usage', 'critical', 'Eval is a security risk and slow.', 'eval_usage')),
+        # Numeric literals
+        ("""
         (number) @num
-        """
-        try:
-            query = Query(self.language, query_scm)
-            cursor = QueryCursor(query)
-            matches = cursor.matches(self.tree.root_node)
-
-            for _, captures in matches:
-                nodes = captures.get('num', [])
-                for node in nodes:
-                    # Tree-sitter returns bytes, decode to string
-                    text = node.text.decode('utf8')
-                    try:
-                        # Handle floats and ints
-                        val = float(text)
-                        if val >= 100 and val not in [1000, 1024, 3600]:
-                             self.violations.append({
-                                'id': 'magic_numbers',
-                                'line': node.start_point[0] + 1,
-                                'severity': 'minor',
-                                'message': f'Magic number "{val}" usage. Use named constants.',
-                                'pattern_match': 'magic_number_js'
-                            })
-                    except ValueError:
-                        pass
-        except Exception as e:
-            logger.error(f"Query error (magic_numbers): {e}")
-
-    def _detect_deprecated_apis(self) -> None:
-        """Detect deprecated or heavy libraries/APIs."""
-        # 1. document.write
-        query_doc_write = """
+        """, '_on_magic_number'),
+        # document.write
+        ("""
         (call_expression
           function: (member_expression
             object: (identifier) @obj
             property: (property_identifier) @prop)
           (#eq? @obj "document")
           (#eq? @prop "write"))
-        """
-        self._run_query(query_doc_write, 'document_write', 'critical',
-                        'document.write blocks rendering.', 'document_write')
-
-        # 2. moment.js (require or import)
+        """, ('document_write', 'critical', 'document.write blocks rendering.', 'document_write')),
         # require('moment')
-        query_require_moment = """
+        ("""
         (call_expression
           function: (identifier) @func
           arguments: (arguments (string (string_fragment) @arg))
           (#eq? @func "require")
           (#match? @arg "moment"))
-        """
-        self._run_query(query_require_moment, 'momentjs_deprecated', 'major',
-                        'Moment.js is heavy. Use Day.js or Date.', 'momentjs_deprecated')
-
+        """, ('momentjs_deprecated', 'major', 'Moment.js is heavy. Use Day.js or Date.', 'momentjs_deprecated')),
         # import ... from 'moment'
-        query_import_moment = """
+        ("""
         (import_statement
             source: (string (string_fragment) @source)
             (#match? @source "moment"))
-        """
-        self._run_query(query_import_moment, 'momentjs_deprecated', 'major',
-                        'Moment.js is heavy. Use Day.js or Date.', 'momentjs_deprecated')
-
-    def _detect_inefficient_browser_apis(self) -> None:
-        """Detect inefficient browser APIs."""
-        # setInterval
-        query_set_interval = """
+        """, ('momentjs_deprecated', 'major', 'Moment.js is heavy. Use Day.js or Date.', 'momentjs_deprecated')),
+        # setInterval()
+        ("""
         (call_expression
           function: (identifier) @func
           (#eq? @func "setInterval"))
-        """
-        self._run_query(query_set_interval, 'setInterval_animation', 'major',
-                        'Use requestAnimationFrame instead of setInterval.', 'setInterval_animation')
-
-        # window.alert/prompt/confirm
-        # Can be called as alert() or window.alert()
-        # Case 1: alert()
-        query_alert_global = """
+        """, ('setInterval_animation', 'major',
+              'Use requestAnimationFrame instead of setInterval.', 'setInterval_animation')),
+        # alert() / prompt() / confirm()
+        ("""
         (call_expression
           function: (identifier) @func
           (#match? @func "^(alert|prompt|confirm)$"))
-        """
-        self._run_query(query_alert_global, 'alert_usage', 'minor',
-                        'Native dialogs block the main thread.', 'alert_usage')
-
-        # Case 2: window.alert()
-        query_alert_window = """
+        """, ('alert_usage', 'minor', 'Native dialogs block the main thread.', 'alert_usage')),
+        # window.alert() / prompt() / confirm()
+        ("""
         (call_expression
           function: (member_expression
             object: (identifier) @obj
             property: (property_identifier) @prop)
           (#eq? @obj "window")
           (#match? @prop "^(alert|prompt|confirm)$"))
-        """
-        self._run_query(query_alert_window, 'alert_usage', 'minor',
-                        'Native dialogs block the main thread.', 'alert_usage')
-
-    def _detect_sync_io(self) -> None:
-        """Detect synchronous I/O."""
-        # readFileSync
-        query_read_file_sync = """
+        """, ('alert_usage', 'minor', 'Native dialogs block the main thread.', 'alert_usage')),
+        # fs.readFileSync()
+        ("""
         (call_expression
           function: (member_expression
             property: (property_identifier) @prop)
           (#match? @prop "readFileSync"))
-        """
-        self._run_query(query_read_file_sync, 'synchronous_io', 'major',
-                        'Synchronous I/O blocks the main thread. Use async APIs.', 'sync_io_js')
-
-        # XMLHttpRequest
-        query_xhr = """
+        """, ('synchronous_io', 'major',
+              'Synchronous I/O blocks the main thread. Use async APIs.', 'sync_io_js')),
+        # new XMLHttpRequest()
+        ("""
         (new_expression
             constructor: (identifier) @cons
             (#eq? @cons "XMLHttpRequest"))
-        """
-        self._run_query(query_xhr, 'synchronous_io', 'major',
-                        'Synchronous I/O blocks the main thread. Use fetch().', 'sync_io_js')
-
-    def _detect_loops(self) -> None:
-        """Detect loop related violations (infinite, nested, inefficient)."""
-        # 1. Infinite loops: while(true)
-        query_infinite = """
+        """, ('synchronous_io', 'major', 'Synchronous I/O blocks the main thread. Use fetch().', 'sync_io_js')),
+        # while (true)
+        ("""
         (while_statement
           condition: (parenthesized_expression (true))) @infinite
-        """
-        self._run_query(query_infinite, 'no_infinite_loops', 'critical',
-                        'Infinite loop detected (while(true)).', 'infinite_while_js')
-
-        # 2. Inefficient C-style loops
-        query_c_loop = """
+        """, ('no_infinite_loops', 'critical', 'Infinite loop detected (while(true)).', 'infinite_while_js')),
+        # C-style for loops
+        ("""
         (for_statement) @loop
-        """
-        self._run_query(query_c_loop, 'inefficient_loop', 'major',
-                        'C-style for loop detected. Consider using .map(), .filter(), or .reduce() for better optimization.', 'c_style_for')
-
-        # 3. Nested loops (Depth check)
-        # We need to traverse the tree or query for loops inside loops
-        # Simple query for direct nesting:
-        query_nested = """
-        (for_statement body: (statement_block (for_statement))) @nested
-        """
-        # Note: This only catches depth 2. For deeper nesting we might need a more general traversal or multiple queries.
-        # But let's start with depth 2 which is the main concern.
-
-        # Actually, let's try to be more generic.
-        # Find all loops, then check their ancestors.
-        loop_types = ['for_statement', 'while_statement', 'do_statement', 'for_in_statement']
-        # Helper to check depth
-
-        try:
-             # Find all loops
-             query_loops = "[(for_statement) (while_statement) (do_statement) (for_in_statement)] @loop"
-             query = Query(self.language, query_loops)
-             cursor = QueryCursor(query)
-             matches = cursor.matches(self.tree.root_node)
-
-             # Include for_of_statement
-             extended_loop_types = loop_types
-
-             for _, captures in matches:
-                 for _, nodes in captures.items():
-                     for node in nodes:
-                         depth = 0
-                         parent = node.parent
-                         while parent:
-                             if parent.type in extended_loop_types:
-                                 depth += 1
-                             parent = parent.parent
-
-                         if depth >= 1: # 1 parent loop means depth 2
-                             total_depth = depth + 1
-                             severity = 'critical' if total_depth >= 3 else 'major'
-                             # We need to manually add violation because _run_query deduplicates by line and doesn't support dynamic message
-                             line = node.start_point[0] + 1
-                             # Check if we already reported this line (maybe not needed as we iterate nodes)
-
-                             self.violations.append({
-                                'id': 'no_n2_algorithms',
-                                'line': line,
-                                'severity': severity,
-                                'message': f'Nesting depth {total_depth}: Potential O(n^{total_depth}) complexity detected.',
-                                'pattern_match': 'nested_loop_js'
-                            })
-        except Exception as e:
-            logger.error(f"Error in nested loop detection: {e}")
-
-    def _detect_dom_manipulation(self) -> None:
-        """Detect DOM manipulation."""
+        """, ('inefficient_loop', 'major',
+              'C-style for loop detected. Consider using .map(), .filter(), or .reduce() for better optimization.',
+              'c_style_for')),
+        # Any loop, checked for enclosing loops
+        ("""
+        [(for_statement) (while_statement) (do_statement) (for_in_statement)] @loop
+        """, '_on_loop'),
         # Direct DOM query
-        query_dom = """
+        ("""
         (call_expression
            function: (member_expression
              object: (identifier) @obj
              property: (property_identifier) @prop)
            (#eq? @obj "document")
            (#match? @prop "^(querySelector|getElementById)$"))
-        """
-        self._run_query(query_dom, 'unnecessary_dom_manipulation', 'major',
-                        'Direct DOM query/manipulation. Cache references.', 'dom_query')
-
-        # DOM in loop
-        # Find DOM methods inside loops
-        dom_methods = ["appendChild", "innerHTML", "textContent", "setAttribute", "classList", "write"]
-        dom_methods_regex = "^(" + "|".join(dom_methods) + ")$"
-
-        query_dom_loop = f"""
+        """, ('unnecessary_dom_manipulation', 'major',
+              'Direct DOM query/manipulation. Cache references.', 'dom_query')),
+        # DOM method calls, checked for enclosing loops
+        (f"""
         (call_expression
            function: (member_expression
              property: (property_identifier) @prop)
-           (#match? @prop "{dom_methods_regex}"))
-
+           (#match? @prop "{_JS_DOM_METHODS_REGEX}"))
+        """, '_on_dom_member'),
+        # DOM property writes, checked for enclosing loops
+        (f"""
         (assignment_expression
            left: (member_expression
              property: (property_identifier) @prop)
-           (#match? @prop "{dom_methods_regex}"))
-        """
-
-        try:
-            query = Query(self.language, query_dom_loop)
-            cursor = QueryCursor(query)
-            matches = cursor.matches(self.tree.root_node)
-
-            loop_types = ['for_statement', 'while_statement', 'do_statement', 'for_in_statement', 'for_of_statement']
-
-            for _, captures in matches:
-                # We only care about the @prop capture
-                nodes = captures.get('prop', [])
-                for node in nodes:
-                    # Check if inside loop
-                    parent = node.parent
-                    in_loop = False
-                    while parent:
-                        if parent.type in loop_types:
-                            in_loop = True
-                            break
-                        parent = parent.parent
-
-                    if in_loop:
-                         # Extract method name for message
-                         method_name = node.text.decode('utf8')
-
-                         self.violations.append({
-                            'id': 'unnecessary_dom_manipulation',
-                            'line': node.start_point[0] + 1,
-                            'severity': 'critical',
-                            'message': f'DOM manipulation "{method_name}" inside loop. Causes reflows/repaints. Batch updates.',
-                            'pattern_match': 'dom_in_loop'
-                        })
-        except Exception as e:
-            logger.error(f"Error in DOM loop detection: {e}")
-
-    def _detect_string_concatenation(self) -> None:
-        """Detect string concatenation in loops."""
-        # += with string
-        # We can't easily check type, but we can check if it looks like a string literal or we can be conservative.
-        # The regex version just checked for += and quote.
-        # Let's check for += and string literal on RHS.
-
-        query_concat = """
+           (#match? @prop "{_JS_DOM_METHODS_REGEX}"))
+        """, '_on_dom_member'),
+        # += with a string literal, checked for enclosing loops
+        ("""
         (augmented_assignment_expression
           operator: ("+=")
           right: [(string) (template_string)]) @concat
+        """, '_on_string_concat'),
+    )
+    _RULES_SCM = "\n".join(scm for scm, _ in RULES)
+    # Violation template per rule tuple (None for method handlers)
+    _RULE_TEMPLATES = tuple(
+        _js_template(handler[0], handler[1], handler[3], handler[2]) if isinstance(handler, tuple) else None
+        for _, handler in RULES
+    )
+
+    def __init__(self, content: str, file_path: str):
+        self.content = content
+        self.file_path = file_path
+        self.violations = []
+        self.tree = None
+        self.language = None
+        self._source_bytes = b''
+        # node id -> number of enclosing loops (including the node itself if it is a loop)
+        self._loop_depths = {}
+        # (id, line, message) keys already reported
+        self._emitted = set()
+        # (line, raw member name) pairs already seen by _on_dom_member
+        self._dom_reported = set()
+
+    def detect_all(self) -> List[Dict]:
         """
+        Run all AST-based detectors in a single query pass over the tree.
+        """
+        # Files without any rule sigil (empty, data-only) are not worth parsing
+        if not _JS_AST_SIGIL_RE.search(self.content):
+            return self.violations
 
         try:
-            query = Query(self.language, query_concat)
-            cursor = QueryCursor(query)
-            matches = cursor.matches(self.tree.root_node)
-
-            loop_types = ['for_statement', 'while_statement', 'do_statement', 'for_in_statement', 'for_of_statement']
-
-            for _, captures in matches:
-                for _, nodes in captures.items():
-                    for node in nodes:
-                        # Check if inside loop
-                        parent = node.parent
-                        in_loop = False
-                        while parent:
-                            if parent.type in loop_types:
-                                in_loop = True
-                                break
-                            parent = parent.parent
-
-                        if in_loop:
-                             self.violations.append({
-                                'id': 'string_concatenation',
-                                'line': node.start_point[0] + 1,
-                                'severity': 'major',
-                                'message': 'String concatenation in loop creates new objects repeatedly.',
-                                'pattern_match': 'string_concat_js'
-                            })
+            self.language = self._get_language()
+            self.parser = Parser(self.language)
+            # Kept so handlers can slice node text straight out of the source
+            self._source_bytes = self.content.encode("utf8")
+            self.tree = self._parse(self._source_bytes)
         except Exception as e:
-            logger.error(f"Error in string concat detection: {e}")
+            # Fallback or log error
+            logger.error(f"Error initializing Tree-sitter for {self.file_path}: {e}")
+            return self.violations
 
-    def _run_query(self, query_scm: str, rule_id: str, severity: str, message: str, pattern_match: str) -> None:
-        """Helper to run tree-sitter queries."""
+        # Resolve the per-pattern handlers once per file: a rule's template is
+        # reported at its first capture, a method name handles captures itself
+        handlers = [getattr(self, handler) if template is None else template
+                    for (_, handler), template in zip(self.RULES, self._RULE_TEMPLATES)]
         try:
-            query = Query(self.language, query_scm)
-            cursor = QueryCursor(query)
-            matches = cursor.matches(self.tree.root_node)
+            cursor = QueryCursor(self._get_query(self._RULES_SCM))
+            for pattern_index, captures in cursor.matches(self.tree.root_node):
+                if not captures:
+                    continue
+                handler = handlers[pattern_index]
+                if isinstance(handler, dict):
+                    first_node = next(iter(captures.values()))[0]
+                    self._emit(handler, first_node.start_point[0] + 1)
+                else:
+                    handler(captures)
+        except Exception as e:
+            logger.error(f"Query error in {self.file_path}: {e}")
+            return self.violations
 
-            # Deduplicate by line to avoid multiple reports for same line
-            reported_lines = set()
+        return self.violations
 
-            for _, captures in matches:
-                if not captures:
+    def _parse(self, source: bytes) -> Tree:
+        """
+        Parse source, reusing this path's previous tree when there is one.
+
+        The old tree is told about the changed byte range (everything between
+        the common prefix and common suffix of the old and new source), so
+        Tree-sitter only re-lexes around the edit.
+        """
+        cache = self._TREE_CACHE
+        cached = cache.pop(self.file_path, None)
+        if cached is None:
+            tree = self.parser.parse(source)
+        else:
+            old_source, old_tree = cached
+            if old_source == source:
+                tree = old_tree
+            else:
+                start = _common_prefix_len(old_source, source)
+                # The suffix may not overlap the prefix in either version
+                limit = min(len(old_source), len(source)) - start
+                suffix = _common_prefix_len(old_source[::-1][:limit], source[::-1][:limit])
+                old_end = len(old_source) - suffix
+                new_end = len(source) - suffix
+                old_tree.edit(
+                    start_byte=start, old_end_byte=old_end, new_end_byte=new_end,
+                    start_point=_byte_point(source, start),
+                    old_end_point=_byte_point(old_source, old_end),
+                    new_end_point=_byte_point(source, new_end),
+                )
+                tree = self.parser.parse(source, old_tree)
+                # Error recovery can settle differently when reusing a tree;
+                # reparse broken sources from scratch so results match a full parse
+                if tree.root_node.has_error:
+                    tree = self.parser.parse(source)
+
+        cache[self.file_path] = (source, tree)
+        if len(cache) > self._TREE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return tree
+
+    def _on_magic_number(self, captures) -> None:
+        """Report numeric literals >= 100 that are not well-known constants."""
+        for node in captures.get('num', []):
+            # Small and exempt literals are skipped on the raw source bytes
+            # before any parsing
+            raw = self._source_bytes[node.start_byte:node.end_byte]
+            if raw in _JS_MAGIC_NUMBER_SKIP_BYTES:
+                continue
+            try:
+                # Handle floats and ints (float() parses the bytes directly)
+                val = float(raw)
+                if val >= 100 and val not in _JS_MAGIC_NUMBER_EXEMPT:
+                    self._emit(_JS_TMPL_MAGIC_NUMBER, node.start_point[0] + 1,
+                               f'Magic number "{val}" usage. Use named constants.')
+            except ValueError:
+                pass
+
+    def _on_loop(self, captures) -> None:
+        """Report loops nested inside other loops, by total nesting depth."""
+        for node in captures.get('loop', []):
+            depth = self._loop_depth(node)
+
+            if depth >= 1: # 1 parent loop means depth 2
+                total_depth = depth + 1
+                template = _JS_TMPL_NESTED_LOOP_CRITICAL if total_depth >= 3 else _JS_TMPL_NESTED_LOOP_MAJOR
+                self._emit(template, node.start_point[0] + 1,
+                           f'Nesting depth {total_depth}: Potential O(n^{total_depth}) complexity detected.')
+
+    def _on_dom_member(self, captures) -> None:
+        """Report DOM members touched inside a loop."""
+        for node in captures.get('prop', []):
+            if self._loop_depth(node) > 0:
+                # Dedupe on the raw name first so repeats skip the decode
+                line = node.start_point[0] + 1
+                raw = self._source_bytes[node.start_byte:node.end_byte]
+                if (line, raw) in self._dom_reported:
                     continue
+                self._dom_reported.add((line, raw))
+
+                # Extract method name for message
+                method_name = raw.decode('utf8')
+
+                self._emit(_JS_TMPL_DOM_IN_LOOP, line,
+                           f'DOM manipulation "{method_name}" inside loop. Causes reflows/repaints. Batch updates.')
+
+    def _on_string_concat(self, captures) -> None:
+        """Report string += inside a loop."""
+        for node in captures.get('concat', []):
+            if self._loop_depth(node) > 0:
+                self._emit(_JS_TMPL_STRING_CONCAT, node.start_point[0] + 1)
+
+    @classmethod
+    def _get_language(cls) -> Language:
+        """Load the JavaScript grammar on first use."""
+        if cls._LANGUAGE is None:
+            cls._LANGUAGE = Language(tree_sitter_javascript.language())
+        return cls._LANGUAGE
+
+    @classmethod
+    def _get_query(cls, query_scm: str) -> Query:
+        """Return the compiled query for query_scm, compiling it on first use."""
+        query = cls._COMPILED_QUERIES.get(query_scm)
+        if query is None:
+            query = cls._COMPILED_QUERIES[query_scm] = Query(cls._get_language(), query_scm)
+        return query
+
+    def _loop_depth(self, node) -> int:
+        """
+        Count the loops enclosing a node.
+
+        Depths are memoized per node id, so the nested-loop, DOM-in-loop and
+        string-concatenation detectors share one climb per ancestor chain
+        instead of each walking to the root for every match.
+        """
+        chain = []
+        parent = node.parent
+        depth = 0
+        while parent:
+            cached = self._loop_depths.get(parent.id)
+            if cached is not None:
+                depth = cached
+                break
+            chain.append(parent)
+            parent = parent.parent
+
+        # Unwind from the outermost uncached ancestor down to the direct parent
+        for ancestor in reversed(chain):
+            if ancestor.type in _LOOP_TYPES:
+                depth += 1
+            self._loop_depths[ancestor.id] = depth
+        return depth
+
+    def _emit(self, template: Dict, line: int, message: Optional[str] = None) -> None:
+        """
+        Record a violation unless the same rule already reported this message on this line.
 
-                # Use the first captured node to determine line number
-                first_node = next(iter(captures.values()))[0]
-                line = first_node.start_point[0] + 1
+        Several queries can land on the same node (e.g. a DOM call matched by
+        both the call and assignment patterns), so reports are deduplicated
+        here rather than per query. The violation is a copy of the template
+        with the line and message filled in.
+        """
+        if message is None:
+            message = template['message']
+        key = (template['id'], line, message)
+        if key in self._emitted:
+            return
+        self._emitted.add(key)
+        violation = template.copy()
+        violation['line'] = line
+        violation['message'] = message
+        self.violations.append(violation)
+
+
+def _walk_of_types(node: ast.AST, types) -> Iterator[ast.AST]:
+    """
+    Like ast.walk(node) (breadth-first, node itself included), but yield only
+    instances of types. Children are read straight off _fields rather than
+    through the iter_child_nodes/iter_fields generators.
+    """
+    AST = ast.AST
+    # Appending to the list being iterated gives breadth-first order
+    todo = [node]
+    for current in todo:
+        if isinstance(current, types):
+            yield current
+        for field in current._fields:
+            value = getattr(current, field, None)
+            if isinstance(value, AST):
+                todo.append(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, AST):
+                        todo.append(item)
+
+
+# Recently parsed Python modules keyed by content digest. The scanner's
+# syntax check and the detector share one parse per file this way. Trees
+# are treated as read-only by everything that takes them from here.
+_PY_PARSE_CACHE_SIZE = 128
+_py_parse_cache: "OrderedDict[bytes, ast.Module]" = OrderedDict()
+
+
+def parse_python(content: str) -> ast.Module:
+    """
+    ast.parse() with a small LRU of recent results.
 
-                if line not in reported_lines:
-                    self.violations.append({
-                        'id': rule_id,
-                        'line': line,
-                        'severity': severity,
-                        'message': message,
-                        'pattern_match': pattern_match
-                    })
-                    reported_lines.add(line)
-        except Exception as e:
-            logger.error(f"Query error ({rule_id}): {e}")
+    Raises:
+        SyntaxError: If content is not valid Python (failures are not cached)
+    """
+    key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    tree = _py_parse_cache.get(key)
+    if tree is None:
+        tree = ast.parse(content)
+        _py_parse_cache[key] = tree
+        if len(_py_parse_cache) > _PY_PARSE_CACHE_SIZE:
+            _py_parse_cache.popitem(last=False)
+    else:
+        _py_parse_cache.move_to_end(key)
+    return tree
 
 
 class PythonViolationDetector(ast.NodeVisitor):
     """AST visitor to detect green software violations in Python code."""
     
-    IO_PATTERNS = {'open', 'read', 'write', 'requests', 'urlopen'}
-    REDUNDANT_FUNCS = {'len', 'range', 're.compile', 'datetime.now', 'time.time'}
-    BLOCKING_IO = {'requests.get', 'urlopen', 'time.sleep'}
+    IO_PATTERNS = _IO_PATTERNS
+    REDUNDANT_FUNCS = _REDUNDANT_FUNCS
+    BLOCKING_IO = _BLOCKING_IO
 
     def __init__(self, content: str, file_path: str):
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
         self.violations = []
         self.current_depth = 0
         self.in_loop = False
@@ -417,69 +774,114 @@ class PythonViolationDetector(ast.NodeVisitor):
         self.unused_variables = {}
         self.used_variables = set()
         self.imports = {}
+        # "import x as y" aliases: bound name -> module
+        self.module_aliases = {}
         self.var_types = {}
+        # (id, line, message) keys already reported, so overlapping loop walks
+        # don't emit the same violation more than once
+        self._seen = set()
+        # Compact (template, line, message) records; dicts are only built once
+        # detection finishes
+        self._records = []
         
     def detect_all(self) -> List[Dict]:
-        """Run all detectors and return violations."""
+        """
+        Run all detectors and return violations.
+        """
         try:
-            tree = ast.parse(self.content)
-            self.visit(tree)
-            
-            # Post-processing for unused detection
-            self._detect_unused_variables()
-            self._detect_unused_imports()
-            
+            tree = parse_python(self.content)
         except SyntaxError:
-            pass
-        
+            # Nothing to analyze
+            return self.violations
+
+        self.visit(tree)
+
+        # Post-processing for unused detection
+        self._detect_unused_variables()
+        self._detect_unused_imports()
+
+        self.violations = [
+            {
+                'id': rule_id,
+                'line': line,
+                'severity': severity,
+                'message': default_message if message is None else message,
+                'pattern_match': pattern_match
+            }
+            for (rule_id, severity, pattern_match, default_message), line, message in self._records
+        ]
         return self.violations
     
+    def _emit(self, template: Tuple[str, str, str, Optional[str]], line: int, message: Optional[str] = None) -> None:
+        """
+        Record a violation built from a module-level template.
+
+        The message defaults to the template's own; duplicates of an already
+        reported (id, line, message) are skipped. Only a small tuple is stored
+        here; detect_all() turns the records into violation dicts.
+        """
+        key = (template[0], line, template[3] if message is None else message)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self._records.append((template, line, message))
+
+    # Node class -> visit_* function, filled in below the class body
+    _VISITORS: Dict[type, object] = {}
+
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch through _VISITORS instead of NodeVisitor's per-node getattr."""
+        handler = self._VISITORS.get(node.__class__, PythonViolationDetector.generic_visit)
+        if handler is not None:
+            handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Visit child nodes straight off _fields, dispatching each through
+        _VISITORS. Children whose class maps to None there have nothing to
+        report and are skipped without a call.
+        """
+        visitors = self._VISITORS
+        default = PythonViolationDetector.generic_visit
+        AST = ast.AST
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, AST):
+                handler = visitors.get(value.__class__, default)
+                if handler is not None:
+                    handler(self, value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, AST):
+                        handler = visitors.get(item.__class__, default)
+                        if handler is not None:
+                            handler(self, item)
+
     def visit_For(self, node: ast.For) -> None:
         """Detect nested loops and I/O in loops."""
         self.current_depth += 1
         
         # Rule: Excessive nesting depth (O(n^2) or worse)
         if self.current_depth >= 2:
-            severity = 'critical' if self.current_depth >= 3 else 'major'
-            self.violations.append({
-                'id': 'no_n2_algorithms',
-                'line': node.lineno,
-                'severity': severity,
-                'message': f'Nesting depth {self.current_depth}: O(n^{self.current_depth}) complexity detected.',
-                'pattern_match': 'nested_for_loop'
-            })
+            template = _TMPL_NESTED_FOR_LOOP_CRITICAL if self.current_depth >= 3 else _TMPL_NESTED_FOR_LOOP_MAJOR
+            self._emit(template, node.lineno,
+                       f'Nesting depth {self.current_depth}: O(n^{self.current_depth}) complexity detected.')
 
         # Rule: Inefficient Loop (range(len))
         if isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Name) and node.iter.func.id == 'range':
             if len(node.iter.args) == 1 and isinstance(node.iter.args[0], ast.Call):
                 arg_call = node.iter.args[0]
                 if isinstance(arg_call.func, ast.Name) and arg_call.func.id == 'len':
-                    self.violations.append({
-                        'id': 'inefficient_loop',
-                        'line': node.lineno,
-                        'severity': 'major',
-                        'message': 'Using range(len(sequence)) is inefficient. Use enumerate() or zip().',
-                        'pattern_match': 'range_len'
-                    })
+                    self._emit(_TMPL_RANGE_LEN, node.lineno)
 
         # Rule: Inefficient Dictionary Iteration (.keys())
         if isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Attribute) and node.iter.func.attr == 'keys':
-            self.violations.append({
-                'id': 'inefficient_dictionary_iteration',
-                'line': node.lineno,
-                'severity': 'minor',
-                'message': 'Iterating over .keys() is redundant. Iterate over the dictionary directly.',
-                'pattern_match': 'dict_keys_iter'
-            })
-        
-        # Rule: Inefficient Lookup (item in list in loop)
-        self._check_inefficient_lookups(node)
+            self._emit(_TMPL_DICT_KEYS_ITER, node.lineno)
         
-        # Check for I/O and redundant computations in loop
+        # Check for list lookups, I/O and redundant computations in loop
         prev_in_loop = self.in_loop
         self.in_loop = True
-        self._check_io_in_loop(node)
-        self._check_unnecessary_computation(node)
+        self._scan_loop_body(node, check_lookups=True)
         
         self.generic_visit(node)
         self.in_loop = prev_in_loop
@@ -500,27 +902,15 @@ class PythonViolationDetector(ast.NodeVisitor):
              is_infinite = True
         
         if is_infinite:
-             self.violations.append({
-                'id': 'no_infinite_loops',
-                'line': node.lineno,
-                'severity': 'critical',
-                'message': 'Infinite loop detected (while True). Ensure break condition exists.',
-                'pattern_match': 'infinite_while'
-            })
+             self._emit(_TMPL_INFINITE_WHILE, node.lineno)
 
         if self.current_depth >= 3:
-            self.violations.append({
-                'id': 'excessive_nesting_depth',
-                'line': node.lineno,
-                'severity': 'critical',
-                'message': f'Nesting depth {self.current_depth}: O(n^{self.current_depth}) complexity detected.',
-                'pattern_match': 'nested_while_loop'
-            })
+            self._emit(_TMPL_NESTED_WHILE_LOOP, node.lineno,
+                       f'Nesting depth {self.current_depth}: O(n^{self.current_depth}) complexity detected.')
         
         prev_in_loop = self.in_loop
         self.in_loop = True
-        self._check_io_in_loop(node)
-        self._check_unnecessary_computation(node)
+        self._scan_loop_body(node)
         
         self.generic_visit(node)
         self.in_loop = prev_in_loop
@@ -532,54 +922,35 @@ class PythonViolationDetector(ast.NodeVisitor):
         self.generic_visit(node)
         self.current_depth -= 1
     
-    def _check_io_in_loop(self, loop_node) -> None:
-        """Check if loop contains I/O operations."""
-        io_patterns = ['open', 'read', 'write', 'requests', 'urlopen']
-        
-        for child in ast.walk(loop_node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name):
-                    if child.func.id in io_patterns:
-                        self.violations.append({
-                            'id': 'io_in_loop',
-                            'line': child.lineno,
-                            'severity': 'critical',
-                            'message': f'I/O operation "{child.func.id}()" in loop. Each call costs 100-1000x more energy.',
-                            'pattern_match': 'io_operation_in_loop'
-                        })
-    
-    def _check_unnecessary_computation(self, loop_node) -> None:
+    def _scan_loop_body(self, loop_node, check_lookups: bool = False) -> None:
         """
-        Check for redundant computations in loop that could be moved outside.
-        E.g., len(s), range(n) if n is constant, re.compile, etc.
+        Check a loop's subtree in a single walk: I/O operations and redundant
+        computations that could be moved outside, plus membership tests on
+        lists (O(n) vs O(1)) when check_lookups is set.
         """
-        redundant_funcs = ['len', 'range', 're.compile', 'datetime.now', 'time.time']
-        
-        for child in ast.walk(loop_node):
+        types = (ast.Call, ast.Compare) if check_lookups else ast.Call
+        for child in _walk_of_types(loop_node, types):
             if isinstance(child, ast.Call):
+                func = child.func
                 func_name = None
-                if isinstance(child.func, ast.Name):
-                    func_name = child.func.id
-                elif isinstance(child.func, ast.Attribute):
+                if isinstance(func, ast.Name):
+                    if func.id in _IO_PATTERNS:
+                        self._emit(_TMPL_IO_OPERATION_IN_LOOP, child.lineno,
+                                   f'I/O operation "{func.id}()" in loop. Each call costs 100-1000x more energy.')
+                    if func.id in _REDUNDANT_NAMES:
+                        func_name = func.id
+                elif isinstance(func, ast.Attribute):
                     # Handle re.compile or similar
-                    if isinstance(child.func.value, ast.Name):
-                        func_name = f"{child.func.value.id}.{child.func.attr}"
-                
-                if func_name in redundant_funcs:
+                    if isinstance(func.value, ast.Name) and (func.value.id, func.attr) in _REDUNDANT_ATTRS:
+                        func_name = f"{func.value.id}.{func.attr}"
+
+                if func_name is not None:
                     # Heuristic: Check if arguments are actually dependent on loop variables
                     # For simplicity in this version, we flag common ones that are often static
-                    self.violations.append({
-                        'id': 'unnecessary_computation',
-                        'line': child.lineno,
-                        'severity': 'critical',
-                        'message': f'Redundant computation "{func_name}()" in loop. Move outside for O(1) impact.',
-                        'pattern_match': 'computation_outside_loop'
-                    })
-    
-    def _check_inefficient_lookups(self, loop_node) -> None:
-        """Check for membership tests on lists inside loops (O(n) vs O(1))."""
-        for child in ast.walk(loop_node):
-            if isinstance(child, ast.Compare):
+                    self._emit(_TMPL_COMPUTATION_OUTSIDE_LOOP, child.lineno,
+                               f'Redundant computation "{func_name}()" in loop. Move outside for O(1) impact.')
+
+            else:
                 for op in child.ops:
                     if isinstance(op, (ast.In, ast.NotIn)):
                         # If the right side is a Name, it might be a list
@@ -590,13 +961,8 @@ class PythonViolationDetector(ast.NodeVisitor):
                             if self.var_types.get(var_name) == 'efficient':
                                 continue
 
-                            self.violations.append({
-                                'id': 'inefficient_lookup',
-                                'line': child.lineno,
-                                'severity': 'medium',
-                                'message': f'Membership test on "{var_name}" inside loop. If it is a list, consider converting to a set for O(1) lookup.',
-                                'pattern_match': 'list_lookup_loop'
-                            })
+                            self._emit(_TMPL_LIST_LOOKUP_LOOP, child.lineno,
+                                       f'Membership test on "{var_name}" inside loop. If it is a list, consider converting to a set for O(1) lookup.')
     
     def visit_BinOp(self, node: ast.BinOp) -> None:
         """Detect string concatenation in loops."""
@@ -618,194 +984,161 @@ class PythonViolationDetector(ast.NodeVisitor):
                 is_string_op = True
 
             if is_string_op:
-                 self.violations.append({
-                    'id': 'string_concatenation_in_loop',
-                    'line': node.lineno,
-                    'severity': 'medium',
-                    'message': 'String concatenation in loop creates O(n²) memory allocations. Use list.append() and "".join().',
-                    'pattern_match': 'string_concat_loop'
-                })
+                 self._emit(_TMPL_STRING_CONCAT_LOOP, node.lineno)
         self.generic_visit(node)
     
     def visit_Call(self, node: ast.Call) -> None:
-        """Detect function calls for I/O and performance issues."""
-        func_name = None
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-            self.used_variables.add(func_name)
-        elif isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
-            func_name = f"{node.func.value.id}.{node.func.attr}"
-
-        if func_name:
+        """
+        Detect function calls for I/O and performance issues.
+
+        node.func is classified once; the per-rule checks that can apply to
+        the called name or attribute are then looked up in _NAME_CALL_RULES /
+        _ATTR_CALL_RULES instead of testing every rule against every call.
+        """
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+            self.used_variables.add(name)
             # Rule: Blocking I/O
-            blocking_io = ['requests.get', 'urlopen', 'time.sleep']
-            if func_name in blocking_io or any(func_name.endswith(f'.{b}') for b in blocking_io):
-                self.violations.append({
-                    'id': 'blocking_io',
-                    'line': node.lineno,
-                    'severity': 'high',
-                    'message': f'Blocking I/O operation "{func_name}()". Consider async/await.',
-                    'pattern_match': 'sync_io'
-                })
-            
-            # Rule: Resource might leak (proper_resource_cleanup)
-            if func_name == 'open' and not self._is_in_context_manager(node):
-                self.violations.append({
-                    'id': 'proper_resource_cleanup',
-                    'line': node.lineno,
-                    'severity': 'high',
-                    'message': 'File opened without context manager. Use "with open()" to ensure closure.',
-                    'pattern_match': 'file_not_closed'
-                })
+            if name in _BLOCKING_IO:
+                self._emit(_TMPL_SYNC_IO, node.lineno,
+                           f'Blocking I/O operation "{name}()". Consider async/await.')
+            rules = self._NAME_CALL_RULES.get(name)
+        elif isinstance(func, ast.Attribute):
+            attr = func.attr
+            # Rule: Blocking I/O ("module.attr" matches a dotted entry, or ends
+            # in an undotted one such as urllib.urlopen)
+            if isinstance(func.value, ast.Name) and (attr in _BLOCKING_IO or (func.value.id, attr) in _BLOCKING_ATTRS):
+                self._emit(_TMPL_SYNC_IO, node.lineno,
+                           f'Blocking I/O operation "{func.value.id}.{attr}()". Consider async/await.')
+            rules = self._ATTR_CALL_RULES.get(attr)
+        else:
+            rules = None
+
+        if rules:
+            for rule in rules:
+                rule(self, node)
 
-            # Rule: Excessive Logging
-            if func_name == 'print':
-                self.violations.append({
-                    'id': 'excessive_logging',
-                    'line': node.lineno,
-                    'severity': 'minor',
-                    'message': 'Usage of "print" detected. Use logging module or remove in production.',
-                    'pattern_match': 'print_usage'
-                })
+        self.generic_visit(node)
 
-        # Rule: Excessive Logging (Logger methods)
-        if isinstance(node.func, ast.Attribute) and node.func.attr in ['debug', 'info', 'log']:
-             # Heuristic: check if called on something like 'args.logger' or 'logging' or 'logger'
-             if isinstance(node.func.value, ast.Name) and node.func.value.id in ['logger', 'logging']:
-                  self.violations.append({
-                    'id': 'excessive_logging',
-                    'line': node.lineno,
-                    'severity': 'minor',
-                    'message': f'Excessive logging call "{node.func.attr}". Verify log levels.',
-                    'pattern_match': 'logging_call'
-                })
+    # Per-rule call checks, dispatched from visit_Call by called name or attribute
 
-        # Rule: Heavy object copying
-        if (isinstance(node.func, ast.Attribute) and node.func.attr == 'deepcopy') or (func_name == 'deepcopy'):
-            self.violations.append({
-                'id': 'heavy_object_copy',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': 'Usage of deepcopy detected. This is computationally expensive.',
-                'pattern_match': 'deepcopy'
-            })
-
-        # Rule: Process Spawning
-        call_s = ast.dump(node.func) # Simplified string check
-        if 'subprocess' in call_s or 'os.system' in call_s or 'popen' in call_s.lower():
-             # Basic filter to avoid false positives if variable names match
-             is_process = False
-             if isinstance(node.func, ast.Attribute):
-                 if node.func.attr in ['run', 'Popen', 'system', 'spawn']:
-                     is_process = True
-             elif func_name in ['system', 'popen', 'spawn']:
-                 is_process = True
-            
-             if is_process:
-                self.violations.append({
-                    'id': 'process_spawning',
-                    'line': node.lineno,
-                    'severity': 'critical',
-                    'message': 'Process spawning detected. High OS overhead.',
-                    'pattern_match': 'process_spawn'
-                })
+    def _rule_open(self, node: ast.Call) -> None:
+        # Rule: Resource might leak (proper_resource_cleanup)
+        if not self._is_in_context_manager(node):
+            self._emit(_TMPL_FILE_NOT_CLOSED, node.lineno)
+
+    def _rule_print(self, node: ast.Call) -> None:
+        # Rule: Excessive Logging
+        self._emit(_TMPL_PRINT_USAGE, node.lineno)
+
+    def _rule_logging_call(self, node: ast.Call) -> None:
+        # Rule: Excessive Logging (Logger methods), called on 'logger' or 'logging'
+        if isinstance(node.func.value, ast.Name) and node.func.value.id in _LOGGER_NAMES:
+            self._emit(_TMPL_LOGGING_CALL, node.lineno,
+                       f'Excessive logging call "{node.func.attr}". Verify log levels.')
 
+    def _rule_deepcopy(self, node: ast.Call) -> None:
+        # Rule: Heavy object copying
+        self._emit(_TMPL_DEEPCOPY, node.lineno)
+
+    def _rule_process_spawn(self, node: ast.Call) -> None:
+        # Rule: Process Spawning, as <module>.<attr>(...) on a process module
+        # (under any "import ... as" alias) or .Popen(...) on anything
+        attr = node.func.attr
+        value = node.func.value
+        if attr in _ANY_RECEIVER_PROCESS_ATTRS:
+            is_process = True
+        elif isinstance(value, ast.Name):
+            module = self.module_aliases.get(value.id, value.id)
+            is_process = attr in _PROCESS_CALLS.get(module, ())
+        else:
+            is_process = False
+        if is_process:
+            self._emit(_TMPL_PROCESS_SPAWN, node.lineno)
+
+    def _rule_process_spawn_name(self, node: ast.Call) -> None:
+        # Rule: Process Spawning, as a bare popen() / Popen() (from os import
+        # popen, from subprocess import Popen)
+        self._emit(_TMPL_PROCESS_SPAWN, node.lineno)
+
+    def _rule_readlines(self, node: ast.Call) -> None:
         # Rule: Inefficient file reading (Attribute call)
-        if isinstance(node.func, ast.Attribute) and node.func.attr == 'readlines':
-            self.violations.append({
-                'id': 'inefficient_file_read',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': 'Using readlines() reads entire file into memory. Iterate file object instead.',
-                'pattern_match': 'readlines'
-            })
+        self._emit(_TMPL_READLINES, node.lineno)
 
+    def _rule_iterrows(self, node: ast.Call) -> None:
         # Rule: Pandas iterrows
-        if isinstance(node.func, ast.Attribute) and node.func.attr == 'iterrows':
-            self.violations.append({
-                'id': 'pandas_iterrows',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': 'Using iterrows() is slow. Use vectorization or apply().',
-                'pattern_match': 'iterrows'
-            })
+        self._emit(_TMPL_ITERROWS, node.lineno)
 
+    def _rule_any_all_list_comp(self, node: ast.Call) -> None:
         # Rule: Any/All List Comprehension
-        if isinstance(node.func, ast.Name) and node.func.id in ['any', 'all']:
-            if node.args and isinstance(node.args[0], ast.ListComp):
-                 self.violations.append({
-                    'id': 'any_all_list_comprehension',
-                    'line': node.lineno,
-                    'severity': 'major',
-                    'message': f'Using list comprehension with {node.func.id}(). Use generator expression for lazy evaluation.',
-                    'pattern_match': 'any_all_list_comp'
-                })
+        if node.args and isinstance(node.args[0], ast.ListComp):
+            self._emit(_TMPL_ANY_ALL_LIST_COMP, node.lineno,
+                       f'Using list comprehension with {node.func.id}(). Use generator expression for lazy evaluation.')
 
+    def _rule_reduce_list_comp(self, node: ast.Call) -> None:
         # Rule: Unnecessary List in Generator (sum/max/min)
-        if isinstance(node.func, ast.Name) and node.func.id in ['sum', 'max', 'min']:
-             if node.args and isinstance(node.args[0], ast.ListComp):
-                 self.violations.append({
-                    'id': 'unnecessary_generator_list',
-                    'line': node.lineno,
-                    'severity': 'minor',
-                    'message': f'Using list comprehension with {node.func.id}(). Use generator expression to save memory.',
-                    'pattern_match': 'generator_list_comp'
-                })
+        if node.args and isinstance(node.args[0], ast.ListComp):
+            self._emit(_TMPL_GENERATOR_LIST_COMP, node.lineno,
+                       f'Using list comprehension with {node.func.id}(). Use generator expression to save memory.')
 
+    def _rule_eager_logging(self, node: ast.Call) -> None:
         # Rule: Eager Logging Formatting
-        if isinstance(node.func, ast.Attribute) and node.func.attr in ['debug', 'info', 'warning', 'error', 'critical']:
+        if not (node.args and isinstance(node.args[0], ast.JoinedStr)):
+            return
+        value = node.func.value
+        # Check for logger.info or logging.info
+        if isinstance(value, ast.Name):
+            is_logger = value.id in _LOGGER_NAMES
+        # Check for self.logger.info or similar attributes ending in logger
+        elif isinstance(value, ast.Attribute):
+            is_logger = value.attr == 'logger' or value.attr.endswith('_logger')
+        else:
             is_logger = False
-            # Check for logger.info or logging.info
-            if isinstance(node.func.value, ast.Name) and node.func.value.id in ['logger', 'logging']:
-                is_logger = True
-            # Check for self.logger.info or similar attributes ending in logger
-            elif isinstance(node.func.value, ast.Attribute) and (node.func.value.attr == 'logger' or node.func.value.attr.endswith('_logger')):
-                is_logger = True
-
-            if is_logger and node.args and isinstance(node.args[0], ast.JoinedStr):
-                self.violations.append({
-                    'id': 'eager_logging_formatting',
-                    'line': node.lineno,
-                    'severity': 'minor',
-                    'message': 'Using f-string in logging. Use lazy formatting (e.g. logger.info("%s", val)) to avoid unnecessary string interpolation.',
-                    'pattern_match': 'eager_logging'
-                })
+        if is_logger:
+            self._emit(_TMPL_EAGER_LOGGING, node.lineno)
+
+    # Called name / attribute -> checks to run, in reporting order
+    _NAME_CALL_RULES = {
+        'open': (_rule_open,),
+        'print': (_rule_print,),
+        'deepcopy': (_rule_deepcopy,),
+        'popen': (_rule_process_spawn_name,),
+        'Popen': (_rule_process_spawn_name,),
+        'any': (_rule_any_all_list_comp,),
+        'all': (_rule_any_all_list_comp,),
+        'sum': (_rule_reduce_list_comp,),
+        'max': (_rule_reduce_list_comp,),
+        'min': (_rule_reduce_list_comp,),
+    }
+    _ATTR_CALL_RULES = {
+        **dict.fromkeys(_PROCESS_ATTRS | _ANY_RECEIVER_PROCESS_ATTRS, (_rule_process_spawn,)),
+        'debug': (_rule_logging_call, _rule_eager_logging),
+        'info': (_rule_logging_call, _rule_eager_logging),
+        'log': (_rule_logging_call,),
+        'warning': (_rule_eager_logging,),
+        'error': (_rule_eager_logging,),
+        'critical': (_rule_eager_logging,),
+        'deepcopy': (_rule_deepcopy,),
+        'readlines': (_rule_readlines,),
+        'iterrows': (_rule_iterrows,),
+    }
 
-        self.generic_visit(node)
-    
     def visit_Global(self, node: ast.Global) -> None:
         """Detect global variable usage."""
-        self.violations.append({
-            'id': 'global_variable_mutation',
-            'line': node.lineno,
-            'severity': 'minor',
-            'message': 'Global variable usage detected. Can hinder optimization.',
-            'pattern_match': 'global_keyword'
-        })
+        self._emit(_TMPL_GLOBAL_KEYWORD, node.lineno)
         self.generic_visit(node)
 
     def visit_Try(self, node: ast.Try) -> None:
         """Detect try-except blocks inside loops."""
         if self.in_loop:
-             self.violations.append({
-                'id': 'exceptions_in_loop',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': 'Try/Except block inside loop. Exception handling is expensive.',
-                'pattern_match': 'try_in_loop'
-            })
+             self._emit(_TMPL_TRY_IN_LOOP, node.lineno)
         self.generic_visit(node)
     
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
         """Detect bare except clauses."""
         if node.type is None:
-            self.violations.append({
-                'id': 'bare_except',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': 'Bare except clause detected. Catch specific exceptions.',
-                'pattern_match': 'bare_except'
-            })
+            self._emit(_TMPL_BARE_EXCEPT, node.lineno)
         self.generic_visit(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
@@ -817,58 +1150,71 @@ class PythonViolationDetector(ast.NodeVisitor):
         prev_var_types = self.var_types.copy()
         self.var_types = {}
         
-        # Calculate cyclomatic complexity
-        complexity = self._calculate_cyclomatic_complexity(node)
-        
+        # Calculate cyclomatic complexity and check for self-calls in one walk
+        complexity, is_recursive = self._analyze_function(node)
+
         if complexity > 10:
-            self.violations.append({
-                'id': 'high_cyclomatic_complexity',
-                'line': node.lineno,
-                'severity': 'medium',
-                'message': f'Function has high cyclomatic complexity ({complexity}). More code paths = more CPU execution.',
-                'pattern_match': 'complex_function'
-            })
+            self._emit(_TMPL_COMPLEX_FUNCTION, node.lineno,
+                       f'Function has high cyclomatic complexity ({complexity}). More code paths = more CPU execution.')
         
         # Rule: Deep Recursion
-        if self._is_recursive(node):
-             self.violations.append({
-                'id': 'deep_recursion',
-                'line': node.lineno,
-                'severity': 'major',
-                'message': f'Recursive function "{node.name}" detected. Deep recursion consumes significant stack memory and CPU.',
-                'pattern_match': 'recursive_function'
-            })
+        if is_recursive:
+             self._emit(_TMPL_RECURSIVE_FUNCTION, node.lineno,
+                        f'Recursive function "{node.name}" detected. Deep recursion consumes significant stack memory and CPU.')
 
         # Rule: Mutable Default Arguments
         defaults = node.args.defaults + node.args.kw_defaults
         if defaults:
             for default in defaults:
                 if default and isinstance(default, (ast.List, ast.Dict, ast.Set)):
-                     self.violations.append({
-                        'id': 'mutable_default_argument',
-                        'line': node.lineno,
-                        'severity': 'major',
-                        'message': 'Mutable default argument detected. Use None and initialize inside function.',
-                        'pattern_match': 'mutable_default'
-                    })
+                     self._emit(_TMPL_MUTABLE_DEFAULT, node.lineno)
 
         self.generic_visit(node)
         self.var_types = prev_var_types # Restore scope
         self.current_function = prev_function
 
-    def _is_recursive(self, node: ast.FunctionDef) -> bool:
-        """Check if function calls itself."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call) and isinstance(child.func, ast.Name):
-                if child.func.id == node.name:
-                    return True
-        return False
+    def _analyze_function(self, node: ast.FunctionDef) -> Tuple[int, bool]:
+        """
+        Calculate a function's cyclomatic complexity and whether it calls
+        itself, in a single walk of its body.
+
+        Nested function definitions are not descended into: visit_FunctionDef
+        reports on them separately, so their branches don't inflate the
+        enclosing function's complexity.
+        """
+        AST = ast.AST
+        Call, Name = ast.Call, ast.Name
+        name = node.name
+        complexity = 1
+        is_recursive = False
+        stack = list(ast.iter_child_nodes(node))
+        pop, push = stack.pop, stack.append
+        while stack:
+            child = pop()
+            if isinstance(child, _BRANCH_TYPES):
+                complexity += 1
+            elif isinstance(child, _FUNCTION_TYPES):
+                continue
+            elif (not is_recursive and isinstance(child, Call)
+                  and isinstance(child.func, Name) and child.func.id == name):
+                is_recursive = True
+            for field in child._fields:
+                value = getattr(child, field, None)
+                if isinstance(value, AST):
+                    push(value)
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, AST):
+                            push(item)
+        return complexity, is_recursive
     
     def visit_Import(self, node: ast.Import) -> None:
         """Track imports for unused detection."""
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             self.imports[name] = node.lineno
+            if alias.asname:
+                self.module_aliases[alias.asname] = alias.name
         self.generic_visit(node)
     
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
@@ -887,21 +1233,10 @@ class PythonViolationDetector(ast.NodeVisitor):
                     var_name = target.id
                     # Check if variable is a string (and accumulating)
                     if self.var_types.get(var_name) == 'str':
-                         # Check if variable is on RHS (recursively)
-                         is_rhs = False
-                         for child in ast.walk(node.value):
-                             if isinstance(child, ast.Name) and child.id == var_name:
-                                 is_rhs = True
-                                 break
-
-                         if is_rhs:
-                             self.violations.append({
-                                'id': 'string_concatenation_in_loop',
-                                'line': node.lineno,
-                                'severity': 'medium',
-                                'message': 'String concatenation in loop creates O(n²) memory allocations. Use list.append() and "".join().',
-                                'pattern_match': 'string_concat_loop'
-                            })
+                         # Check if variable is on RHS (recursively), stopping
+                         # at the first occurrence
+                         if any(child.id == var_name for child in _walk_of_types(node.value, ast.Name)):
+                             self._emit(_TMPL_STRING_CONCAT_LOOP, node.lineno)
                              break
 
         for target in node.targets:
@@ -910,7 +1245,7 @@ class PythonViolationDetector(ast.NodeVisitor):
                 # Try to infer type
                 if isinstance(node.value, ast.List) or (isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id == 'list'):
                     self.var_types[target.id] = 'list'
-                elif isinstance(node.value, (ast.Set, ast.Dict)) or (isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id in ['set', 'dict']):
+                elif isinstance(node.value, (ast.Set, ast.Dict)) or (isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id in _EFFICIENT_CONTAINER_FUNCS):
                     self.var_types[target.id] = 'efficient'
                 elif isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
                     self.var_types[target.id] = 'str'
@@ -924,16 +1259,13 @@ class PythonViolationDetector(ast.NodeVisitor):
     
     def visit_Constant(self, node: ast.Constant) -> None:
         """Detect magic numbers (Python 3.8+)."""
-        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
-            if node.value > 100 and node.value not in [1000, 1024, 60, 3600]: # Exempt common constants
-                self.violations.append({
-                    'id': 'magic_numbers',
-                    'line': node.lineno,
-                    'severity': 'minor',
-                    'message': f'Magic number "{node.value}" usage. Use named constants.',
-                    'pattern_match': 'magic_number'
-                })
-        self.generic_visit(node)
+        # Exact type checks: bool is an int subclass but never a magic number.
+        # A Constant has no child nodes, so there is nothing to visit below it.
+        value = node.value
+        value_type = type(value)
+        if (value_type is int or value_type is float) and value > 100 and value not in _MAGIC_NUMBER_EXEMPT:
+            self._emit(_TMPL_MAGIC_NUMBER, node.lineno,
+                       f'Magic number "{value}" usage. Use named constants.')
 
     def visit_With(self, node: ast.With) -> None:
         """Detect context managers (proper cleanup)."""
@@ -947,37 +1279,35 @@ class PythonViolationDetector(ast.NodeVisitor):
         # Simplified check - would need to track parent nodes properly
         return False
     
-    def _calculate_cyclomatic_complexity(self, node) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With)):
-                complexity += 1
-        return complexity
-    
     def _detect_unused_variables(self) -> None:
         """Detect unused variables."""
         for var_name, line_num in self.unused_variables.items():
             if var_name not in self.used_variables and not var_name.startswith('_'):
-                self.violations.append({
-                    'id': 'unused_variables',
-                    'line': line_num,
-                    'severity': 'medium',
-                    'message': f'Unused variable "{var_name}". Remove to free memory.',
-                    'pattern_match': 'unused_var'
-                })
+                self._emit(_TMPL_UNUSED_VAR, line_num,
+                           f'Unused variable "{var_name}". Remove to free memory.')
     
     def _detect_unused_imports(self) -> None:
         """Detect unused imports."""
         for import_name, line_num in self.imports.items():
             if import_name not in self.used_variables:
-                self.violations.append({
-                    'id': 'unused_imports',
-                    'line': line_num,
-                    'severity': 'low',
-                    'message': f'Unused import "{import_name}". Module load adds startup time and memory.',
-                    'pattern_match': 'unused_import'
-                })
+                self._emit(_TMPL_UNUSED_IMPORT, line_num,
+                           f'Unused import "{import_name}". Module load adds startup time and memory.')
+
+
+PythonViolationDetector._VISITORS = {
+    # Node classes without fields (expression contexts, operators, pass/break/
+    # continue) have no children and no visit_* method: skip them outright
+    **{
+        cls: None
+        for cls in vars(ast).values()
+        if isinstance(cls, type) and issubclass(cls, ast.AST) and not cls._fields
+    },
+    **{
+        getattr(ast, name[len('visit_'):]): func
+        for name, func in vars(PythonViolationDetector).items()
+        if name.startswith('visit_') and isinstance(getattr(ast, name[len('visit_'):], None), type)
+    },
+}
 
 
 class PatternBasedDetector:
@@ -986,47 +1316,83 @@ class PatternBasedDetector:
     def __init__(self, content: str, file_path: str):
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
         self.violations = []
+        # Offset at which each line starts, for mapping match offsets to line
+        # numbers without splitting the content into per-line strings
+        self._line_starts = [0]
+        self._line_starts.extend(match.end() for match in _RE_NEWLINE.finditer(content))
+
+    @property
+    def lines(self) -> List[str]:
+        """Source lines, split on demand for the line-oriented checks."""
+        return self.content.split('\n')
     
     def detect_all(self) -> List[Dict]:
         """Run all pattern-based detectors."""
+        # Pure pattern checks scan the whole buffer with finditer
         self._detect_redundant_computation()
+        self._detect_inefficient_data_structures()
         # self._detect_string_concatenation() # Handled by AST
         self._detect_dead_code()
-        self._detect_inefficient_data_structures()
         
         return self.violations
+
+    def _matching_lines(self, pattern: re.Pattern, literal: str):
+        """Yield each line number containing a match of pattern, once per line."""
+        if literal not in self.content:
+            return
+        last_line = 0
+        for match in pattern.finditer(self.content):
+            line_num = bisect_right(self._line_starts, match.start())
+            if line_num != last_line:
+                last_line = line_num
+                yield line_num
     
     def _detect_redundant_computation(self) -> None:
-        """Detect expensive operations that could be moved outside loops."""
-        patterns = [
-            (r'for\s+\w+\s+in\s+.*:\s*[^\n]*len\(', 'len() in loop'),
-            (r'for\s+\w+\s+in\s+.*:\s*[^\n]*\.count\(', '.count() in loop'),
-            (r'for\s+\w+\s+in\s+.*:\s*[^\n]*re\.compile\(', 're.compile() in loop'),
-        ]
-        
-        for line_num, line in enumerate(self.lines, 1):
-            for pattern, desc in patterns:
-                if re.search(pattern, line):
-                    self.violations.append({
-                        'id': 'unnecessary_computation',
-                        'line': line_num,
-                        'severity': 'critical',
-                        'message': f'Redundant computation detected ({desc}). Move outside loop.',
-                        'pattern_match': 'computation_outside_loop'
-                    })
+        """
+        Detect expensive operations that could be moved outside loops.
+
+        Reported once per call kind per line: repeated len() calls on one
+        line give one finding, len() and .count() on one line give two.
+        """
+        if 'for' not in self.content:
+            return
+        # Lines are collected per kind so reports keep their per-kind order
+        lines_by_kind = {group: [] for group, _ in _REDUNDANT_COMPUTATION_KINDS}
+        last_line = 0
+        for match in _REDUNDANT_COMPUTATION_RE.finditer(self.content):
+            if match.lastindex is None:
+                continue
+            # A line's first header reaches its earliest colon, so it sees
+            # every kind later headers on the same line could
+            line_num = bisect_right(self._line_starts, match.start())
+            if line_num == last_line:
+                continue
+            last_line = line_num
+            for group, lines in lines_by_kind.items():
+                if match.group(group) is not None:
+                    lines.append(line_num)
+
+        for group, desc in _REDUNDANT_COMPUTATION_KINDS:
+            for line_num in lines_by_kind[group]:
+                self.violations.append({
+                    'id': 'unnecessary_computation',
+                    'line': line_num,
+                    'severity': 'critical',
+                    'message': f'Redundant computation detected ({desc}). Move outside loop.',
+                    'pattern_match': 'computation_outside_loop'
+                })
     
     def _detect_string_concatenation(self) -> None:
         """Detect string concatenation in loops."""
         in_loop = False
         for line_num, line in enumerate(self.lines, 1):
-            if re.search(r'\bfor\b', line):
+            if _RE_PY_FOR.search(line):
                 in_loop = True
-            elif re.search(r'^(?!\s)', line):  # Dedent
+            elif _RE_DEDENT.search(line):  # Dedent
                 in_loop = False
             
-            if in_loop and re.search(r'\+=\s*["\']', line):
+            if in_loop and _RE_STR_CONCAT.search(line):
                 self.violations.append({
                     'id': 'string_concatenation_in_loop',
                     'line': line_num,
@@ -1037,39 +1403,41 @@ class PatternBasedDetector:
     
     def _detect_dead_code(self) -> None:
         """Detect unreachable code."""
-        for line_num, line in enumerate(self.lines, 1):
-            # Simple pattern: code after return/raise
-            if line_num < len(self.lines):
-                current = line.strip()
-                next_line = self.lines[line_num].strip()
-                
-                if current.startswith('return') or current.startswith('raise'):
-                    if next_line and not next_line.startswith(('except', 'finally', 'elif', 'else', '@', 'def', 'class')):
-                        self.violations.append({
-                            'id': 'dead_code_block',
-                            'line': line_num + 1,
-                            'severity': 'medium',
-                            'message': 'Unreachable code after return/raise. Dead code increases memory.',
-                            'pattern_match': 'dead_code'
-                        })
+        content = self.content
+        line_starts = self._line_starts
+        last_index = len(line_starts) - 1
+        # Simple pattern: code after return/raise. A literal scan finds the
+        # candidates, so only lines mentioning either are looked at
+        for match in _RE_RETURN_OR_RAISE.finditer(content):
+            pos = match.start()
+            line_num = bisect_right(line_starts, pos)
+            line_start = line_starts[line_num - 1]
+            # The line must start with it (after indentation)
+            if pos != line_start and not content[line_start:pos].isspace():
+                continue
+            if line_num <= last_index:
+                next_end = line_starts[line_num + 1] - 1 if line_num < last_index else len(content)
+                next_line = content[line_starts[line_num]:next_end].strip()
+                if next_line and not next_line.startswith(_DEAD_CODE_EXEMPT_PREFIXES):
+                    self.violations.append({
+                        'id': 'dead_code_block',
+                        'line': line_num + 1,
+                        'severity': 'medium',
+                        'message': 'Unreachable code after return/raise. Dead code increases memory.',
+                        'pattern_match': 'dead_code'
+                    })
     
     def _detect_inefficient_data_structures(self) -> None:
         """Detect inefficient data structure usage."""
-        patterns = [
-            (r'\.index\([^)]*\)\s*[!=]=', '.index() for lookup (O(n)), use set'),
-            (r'\.count\([^)]*\)', '.count() for membership test (O(n)), use set'),
-        ]
-        
-        for line_num, line in enumerate(self.lines, 1):
-            for pattern, message in patterns:
-                if re.search(pattern, line):
-                    self.violations.append({
-                        'id': 'inefficient_data_structure',
-                        'line': line_num,
-                        'severity': 'high',
-                        'message': message,
-                        'pattern_match': 'data_struct_usage'
-                    })
+        for pattern, literal, message in _INEFFICIENT_DATA_STRUCTURE_PATTERNS:
+            for line_num in self._matching_lines(pattern, literal):
+                self.violations.append({
+                    'id': 'inefficient_data_structure',
+                    'line': line_num,
+                    'severity': 'high',
+                    'message': message,
+                    'pattern_match': 'data_struct_usage'
+                })
     
     def _detect_pandas_inefficiency(self) -> None:
         """Detect pandas inefficiencies via regex for simple cases."""
@@ -1083,7 +1451,8 @@ class JavaScriptViolationDetector:
     def __init__(self, content: str, file_path: str):
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
+        # Source bytes for the tokenizer: one byte per char on ASCII code
+        self._raw = content.encode('utf-8', 'replace')
         self.violations = []
     
     def detect_all(self) -> List[Dict]:
@@ -1095,66 +1464,167 @@ class JavaScriptViolationDetector:
 
     def _detect_unused_variables(self, file_path=None) -> None:
         """Detect unused variables (basic heuristic)."""
-        # Find declarations: let/const/var name = ...
-        # Dictionary to track counts
-        var_counts = {}
-        declarations = []
-        
-        # 1. Find all words to count usage (simple tokenizer)
-        words = re.findall(r'\b\w+\b', self.content)
-        for word in words:
-            var_counts[word] = var_counts.get(word, 0) + 1
-            
-        # 2. Find specific declarations to report errors
-        pattern = r'(let|const|var)\s+(\w+)\s*='
-        for line_num, line in enumerate(self.lines, 1):
-            matches = re.finditer(pattern, line)
-            for match in matches:
-                var_name = match.group(2)
-                # Filter out likely false positives (short vars, exports, etc if needed)
-                if len(var_name) > 1:
-                    declarations.append((var_name, line_num))
-
-        # 3. Check if declared vars are used elsewhere
-        for var_name, line_num in declarations:
-            # If count is 1, it matches only the detected declaration (roughly)
-            # This is a heuristic and can be fooled by comments / strings, 
-            # but fits the "basic regex check" requirement.
-            if var_counts.get(var_name, 0) == 1:
+        raw = self._raw
+        # Declarations need '='; without one there is nothing to report
+        if b'=' not in raw:
+            return
+        raw = _blank_js_template_text(raw)
+
+        # Tally every token outside comments, strings and template text: a declaration
+        # (let/const/var name =) counts as (name, b''), any other word as
+        # (b'', word)
+        token_counts = Counter(_JS_TOKEN_COUNT_RE.findall(raw))
+
+        # A declared name is unused when that declaration is its only
+        # occurrence: declared once and never seen as a plain word.
+        # Filter out likely false positives (short vars, exports, etc if needed)
+        unused = {
+            name for (name, _), count in token_counts.items()
+            if name and count == 1 and (b'', name) not in token_counts
+            and len(name.decode('utf-8', 'replace')) > 1
+        }
+        if not unused:
+            return
+
+        # Only files with something to report pay for locating declarations
+        line_num = 1
+        last_pos = 0
+        for match in _JS_TOKEN_RE.finditer(raw):
+            if match.lastgroup != 'decl':
+                continue
+            var_name = match.group('name')
+            if var_name in unused:
+                line_num += raw.count(b'\n', last_pos, match.start())
+                last_pos = match.start()
                 self.violations.append({
                     'id': 'unused_variables',
                     'line': line_num,
                     'severity': 'minor',
-                    'message': f'Variable "{var_name}" appears to be unused.',
+                    'message': f'Variable "{var_name.decode("utf-8", "replace")}" appears to be unused.',
                     'pattern_match': 'unused_var_js'
                 })
 
 
+# Detectors run for each language, in order: AST-based first, then the
+# pattern-based rules that remain outside the AST
+_DETECTORS_BY_LANG = {
+    'python': (PythonViolationDetector, PatternBasedDetector),
+    'javascript': (JavaScriptASTDetector, JavaScriptViolationDetector),
+}
+
+# In-memory LRU of detection results keyed by (language, content digest)
+_DETECTION_CACHE_SIZE = 4096
+_detection_cache: "OrderedDict[Tuple[str, bytes], Tuple[Dict, ...]]" = OrderedDict()
+
 
 def detect_violations(content: str, file_path: str, language: str = 'python') -> List[Dict]:
     """
     Detect all violations in code.
     
+    Results are memoized by content hash (not path), so re-scanning an
+    unchanged or identical file skips the detectors entirely: first in an
+    in-process LRU, then in the persistent ViolationCache, which survives
+    across runs and covers the pattern-based detectors too.
+
     Returns a list of violations with id, line, severity, message, pattern_match.
     """
+    key = (language, hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+    cached = _detection_cache.get(key)
+    if cached is None:
+        persistent_key = ViolationCache.key(f'detect:{language}', content)
+        stored = ViolationCache.get(persistent_key)
+        if stored is None:
+            stored = _run_detectors(content, file_path, language)
+            ViolationCache.put(persistent_key, stored)
+        cached = tuple(stored)
+        _detection_cache[key] = cached
+        if len(_detection_cache) > _DETECTION_CACHE_SIZE:
+            _detection_cache.popitem(last=False)
+    else:
+        _detection_cache.move_to_end(key)
+
+    # Hand out copies so callers can't mutate the cached entries
+    return [dict(v) for v in cached]
+
+
+def _detect_one(item: Tuple[str, str, str]) -> List[Dict]:
+    """Process-pool entry point for detect_violations_batch."""
+    content, file_path, language = item
+    return detect_violations(content, file_path, language)
+
+
+# Source file extension -> detector language, for path-only entry points
+_LANGUAGE_BY_EXT = {'.py': 'python', '.js': 'javascript'}
+
+
+def _analyze_path(file_path: str) -> List[Dict]:
+    """Process-pool entry point for analyze_files; the worker reads the file itself."""
+    language = _LANGUAGE_BY_EXT.get(os.path.splitext(file_path)[1].lower())
+    if language is None:
+        return []
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Skipping {file_path}: {e}")
+        return []
+    return detect_violations(content, file_path, language)
+
+
+def _map_in_pool(func: Callable[[Any], List[Dict]], items: List[Any], workers: Optional[int]) -> List[List[Dict]]:
+    """
+    Apply func to every item in a spawn-context process pool, in input order.
+
+    Runs inline for a single worker or item. func must be a module-level
+    function so the spawned workers can import it.
+    """
+    if workers == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    # 'spawn' matches Scanner.scan and stays safe under eventlet monkey patching
+    mp_context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        # Batch items per task to amortize pickling and IPC, but keep enough
+        # tasks that every worker gets a share
+        chunksize = max(1, min(32, len(items) // ((workers or os.cpu_count() or 1) * 4)))
+        return list(executor.map(func, items, chunksize=chunksize))
+
+
+def analyze_files(paths: List[str], workers: Optional[int] = None) -> Dict[str, List[Dict]]:
+    """
+    Detect violations for many files on disk in parallel.
+
+    Language is taken from the file extension; unsupported or unreadable
+    files map to an empty list. Workers read the files themselves, so only
+    paths and results cross the process boundary.
+
+    Args:
+        paths: Paths to .py / .js files
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Mapping of path to its violation list.
+    """
+    return dict(zip(paths, _map_in_pool(_analyze_path, paths, workers)))
+
+
+def detect_violations_batch(files: List[Tuple[str, str, str]], workers: Optional[int] = None) -> List[List[Dict]]:
+    """
+    Detect violations for many files in parallel.
+
+    Args:
+        files: (content, file_path, language) tuples
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        One violation list per input file, in input order.
+    """
+    return _map_in_pool(_detect_one, files, workers)
+
+
+def _run_detectors(content: str, file_path: str, language: str) -> List[Dict]:
+    """Run every detector registered for the language."""
     violations = []
-    
-    if language == 'python':
-        # AST-based detection
-        ast_detector = PythonViolationDetector(content, file_path)
-        violations.extend(ast_detector.detect_all())
-        
-        # Pattern-based detection
-        pattern_detector = PatternBasedDetector(content, file_path)
-        violations.extend(pattern_detector.detect_all())
-    
-    elif language == 'javascript':
-        # AST-based detection
-        js_ast_detector = JavaScriptASTDetector(content, file_path)
-        violations.extend(js_ast_detector.detect_all())
-
-        # Regex-based detection (legacy/remaining rules)
-        js_detector = JavaScriptViolationDetector(content, file_path)
-        violations.extend(js_detector.detect_all())
-    
+    for detector_cls in _DETECTORS_BY_LANG.get(language, ()):
+        violations.extend(detector_cls(content, file_path).detect_all())
     return violations
@@ -4,10 +4,13 @@ Implements strictly typed Pydantic models for core entities.
 """
 
 from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from collections import Counter
+from operator import attrgetter
 from enum import Enum
 from datetime import datetime, timezone
 import uuid
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, TypeAdapter, ValidationError
 
 class ViolationSeverity(str, Enum):
     """Severity levels for violations."""
@@ -19,6 +22,8 @@ class ViolationSeverity(str, Enum):
     LOW = "low"
     INFO = "info"
 
+_ALL_SEVS = tuple(sev.value for sev in ViolationSeverity)
+
 class Violation(BaseModel):
     """
     Represents a single green software violation.
@@ -29,7 +34,11 @@ class Violation(BaseModel):
     message: str
     pattern_match: Optional[str] = None
 
-    model_config = ConfigDict(extra='ignore')
+    # Findings are immutable once recorded; frozen also makes them hashable
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+# Validates a whole scan's violations in one call into pydantic-core
+_VIOLATIONS_ADAPTER = TypeAdapter(List[Violation])
 
 class ViolationDetails(BaseModel):
     """Counts of violations by severity."""
@@ -41,7 +50,15 @@ class ViolationDetails(BaseModel):
     low: int = 0
     info: int = 0
 
-    model_config = ConfigDict(extra='ignore')
+    # Shared between scans when counts don't change, so never mutated in place
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+# Reads a ViolationDetails' counts as a tuple in _ALL_SEVS order
+_DETAIL_COUNTS = attrgetter(*_ALL_SEVS)
+
+# Upper bound of latest_violations for each grade but the last
+_GRADE_THRESHOLDS = (0, 5, 10, 20)
+_GRADES = "ABCDF"
 
 class Project(BaseModel):
     """
@@ -83,16 +100,7 @@ class Project(BaseModel):
         Returns:
             Grade letter (A, B, C, D, F)
         """
-        if self.latest_violations == 0:
-            return "A"
-        elif self.latest_violations <= 5:
-            return "B"
-        elif self.latest_violations <= 10:
-            return "C"
-        elif self.latest_violations <= 20:
-            return "D"
-        else:
-            return "F"
+        return _GRADES[bisect_left(_GRADE_THRESHOLDS, self.latest_violations)]
 
     @property
     def high_violations(self) -> int:
@@ -131,39 +139,54 @@ class Project(BaseModel):
             self.violations = []
             self.violation_details = ViolationDetails()
         else:
-            valid_violations = []
-            details = {sev.value: 0 for sev in ViolationSeverity}
-
-            for v_data in violations:
-                try:
-                    # Create Violation object (validates severity)
-                    violation = Violation(**v_data)
-                    valid_violations.append(violation)
-
-                    # Update details count
-                    details[violation.severity.value] += 1
-
-                except (ValueError, TypeError):
-                    # Fallback for invalid violations?
-                    # For now, skip or log. We'll skip to ensure strict typing in 'violations' list.
-                    # Or we could try to coerce severity to 'low'.
-                    if isinstance(v_data, dict):
-                         # Try to salvage with default severity
-                         v_data_fixed = v_data.copy()
-                         v_data_fixed['severity'] = ViolationSeverity.LOW
-                         try:
-                            violation = Violation(**v_data_fixed)
-                            valid_violations.append(violation)
-                            details[ViolationSeverity.LOW.value] += 1
-                         except:
-                            pass
+            if not isinstance(violations, list):
+                violations = list(violations)
+            try:
+                # Common case: every violation is well-formed
+                valid_violations = _VIOLATIONS_ADAPTER.validate_python(violations)
+            except ValidationError:
+                valid_violations = self._validate_violations_salvaging(violations)
+
+            # Tally severities in one pass; members hash like their str values
+            sev_counts = Counter(map(attrgetter('severity'), valid_violations))
+            counts = tuple(sev_counts[sev] for sev in _ALL_SEVS)
 
             self.violations = valid_violations
             self.latest_violations = len(valid_violations)
-            self.violation_details = ViolationDetails(**details)
+            # Unchanged counts (a repeat scan) keep the existing details
+            if counts != _DETAIL_COUNTS(self.violation_details):
+                self.violation_details = ViolationDetails(**dict(zip(_ALL_SEVS, counts)))
 
         self.total_emissions = round(emissions, 9)
 
+    @staticmethod
+    def _validate_violations_salvaging(violations: List[Any]) -> List[Violation]:
+        """Validate violations one by one, salvaging bad severities as low."""
+        valid_violations = []
+
+        for v_data in violations:
+            try:
+                # Create Violation object (validates severity)
+                violation = Violation.model_validate(v_data)
+                valid_violations.append(violation)
+
+            except (ValueError, TypeError):
+                # Fallback for invalid violations?
+                # For now, skip or log. We'll skip to ensure strict typing in 'violations' list.
+                # Or we could try to coerce severity to 'low'.
+                if isinstance(v_data, dict):
+                     # Try to salvage with default severity
+                     v_data_fixed = v_data.copy()
+                     v_data_fixed['severity'] = ViolationSeverity.LOW
+                     try:
+                        violation = Violation(**v_data_fixed)
+                        valid_violations.append(violation)
+                     except (ValidationError, TypeError):
+                        # Still invalid (or non-string keys); drop it
+                        pass
+
+        return valid_violations
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return self.model_dump()
@@ -8,14 +8,56 @@ import csv
 import os
 import json
 import html
+import math
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON export when installed
+    orjson = None
 
 
 # Default output directory for all exports
 OUTPUT_DIR = Path(__file__).parent.parent.parent / 'output'
 
+# Severity levels reported in summaries, most severe first
+_SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low', 'info')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether value holds a NaN or infinite float, looking through dicts and lists."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_has_non_finite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite, value))
+    return False
+
+
+@contextmanager
+def _replace_on_success(path: str, **open_kwargs) -> Iterator[TextIO]:
+    """
+    Open a temporary file beside path for writing and move it over path
+    only once the block completes, so a failure part-way through never
+    leaves a truncated file behind.
+    """
+    tmp_path = f'{path}.tmp'
+    try:
+        with open(tmp_path, 'w', **open_kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class JSONExporter:
     """Export scan results to JSON format."""
@@ -53,8 +95,24 @@ class JSONExporter:
         results['metadata']['exported_at'] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         results['metadata']['project_name'] = project_name
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        # Both encoders write the same data: UTF-8 text unescaped, and NaN or
+        # infinite floats rejected with ValueError. orjson would silently turn
+        # those into null, so such results always take the stdlib path, which
+        # raises for them.
+        data = None
+        if orjson is not None and not _has_non_finite(results):
+            try:
+                data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Values orjson can't encode (e.g. ints wider than 64 bits)
+                # go through the stdlib encoder instead
+                pass
+        if data is None:
+            data = json.dumps(results, indent=2, ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+        # Buffered once and written in a single call
+        with open(self.output_path, 'wb') as f:
+            f.write(data)
 
         return self.output_path
 
@@ -141,29 +199,39 @@ class CSVExporter:
         """
         issues = results.get('issues', [])
         
+        # Each severity is lowercased once and reused for sorting, counting
+        # and the severity column
+        rows = [(issue.get('severity', 'info').lower(), issue) for issue in issues]
+
         # Sort by severity (critical first) then by file
         severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
-        sorted_issues = sorted(
-            issues,
-            key=lambda x: (
-                severity_order.get(x.get('severity', 'info').lower(), 5),
-                x.get('file', ''),
-                x.get('line', 0)
+        rows.sort(
+            key=lambda row: (
+                severity_order.get(row[0], 5),
+                row[1].get('file', ''),
+                row[1].get('line', 0)
             )
         )
         
-        # Calculate totals
-        total_violations = len(sorted_issues)
-        critical_count = sum(1 for i in sorted_issues if i.get('severity', '').lower() == 'critical')
-        high_count = sum(1 for i in sorted_issues if i.get('severity', '').lower() == 'high')
-        medium_count = sum(1 for i in sorted_issues if i.get('severity', '').lower() == 'medium')
-        low_count = sum(1 for i in sorted_issues if i.get('severity', '').lower() == 'low')
+        # Calculate totals and effort in one pass over the issues
+        total_violations = len(rows)
+        effort_scores = {'high': 3, 'medium': 2, 'easy': 1, 'trivial': 0}
+        severity_counts = Counter()
+        efforts = []
+        total_effort = 0
+        for severity, issue in rows:
+            severity_counts[severity] += 1
+            effort = self._get_effort(issue)
+            efforts.append(effort)
+            total_effort += effort_scores.get(effort, 1)
+        critical_count = severity_counts['critical']
+        high_count = severity_counts['high']
+        medium_count = severity_counts['medium']
+        low_count = severity_counts['low']
         
         # Average effort (simplified)
-        effort_scores = {'high': 3, 'medium': 2, 'easy': 1, 'trivial': 0}
         avg_effort = 'medium'
         if total_violations > 0:
-            total_effort = sum(effort_scores.get(self._get_effort(i), 1) for i in sorted_issues)
             avg_effort_score = total_effort / total_violations
             for effort_level, score in [('high', 2.5), ('medium', 1.5), ('easy', 0.5)]:
                 if avg_effort_score >= score:
@@ -172,37 +240,41 @@ class CSVExporter:
         
         with open(self.output_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
             fieldnames = ['file', 'line', 'rule_id', 'severity', 'message', 'energy_factor', 'effort']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            # Plain rows in fieldnames order; csv.writer skips DictWriter's
+            # per-row dict-to-list conversion
+            writer = csv.writer(csvfile)
             
             # Write header
-            writer.writeheader()
+            writer.writerow(fieldnames)
             
             # Write issues
-            for issue in sorted_issues:
-                writer.writerow({
-                    'file': issue.get('file', 'unknown'),
-                    'line': issue.get('line', 0),
-                    'rule_id': issue.get('id', 'unknown_rule'),
-                    'severity': issue.get('severity', 'info').lower(),
-                    'message': issue.get('message', 'No message'),
-                    'energy_factor': self._get_energy_factor(issue),
-                    'effort': self._get_effort(issue)
-                })
+            writer.writerows(
+                (
+                    issue.get('file', 'unknown'),
+                    issue.get('line', 0),
+                    issue.get('id', 'unknown_rule'),
+                    severity,
+                    issue.get('message', 'No message'),
+                    self._get_energy_factor(issue),
+                    effort
+                )
+                for (severity, issue), effort in zip(rows, efforts)
+            )
             
             # Write summary row
             codebase_emissions = results.get('codebase_emissions', 0)
             scanning_emissions = results.get('scanning_emissions', 0)
             total_emissions = codebase_emissions + scanning_emissions
             
-            writer.writerow({
-                'file': 'SUMMARY',
-                'line': '',
-                'rule_id': '',
-                'severity': '',
-                'message': f'Total Violations: {total_violations} | Critical: {critical_count} | High: {high_count} | Medium: {medium_count} | Low: {low_count} | Avg Effort: {avg_effort} | CO2: {codebase_emissions:.9f}kg',
-                'energy_factor': f'{total_emissions:.9f}kg',
-                'effort': 'varies'
-            })
+            writer.writerow((
+                'SUMMARY',
+                '',
+                '',
+                '',
+                f'Total Violations: {total_violations} | Critical: {critical_count} | High: {high_count} | Medium: {medium_count} | Low: {low_count} | Avg Effort: {avg_effort} | CO2: {codebase_emissions:.9f}kg',
+                f'{total_emissions:.9f}kg',
+                'varies'
+            ))
         
         return self.output_path
     
@@ -218,28 +290,22 @@ class CSVExporter:
         """
         issues = results.get('issues', [])
         
-        severity_counts = {
-            'critical': sum(1 for i in issues if i.get('severity', '').lower() == 'critical'),
-            'high': sum(1 for i in issues if i.get('severity', '').lower() == 'high'),
-            'medium': sum(1 for i in issues if i.get('severity', '').lower() == 'medium'),
-            'low': sum(1 for i in issues if i.get('severity', '').lower() == 'low'),
-            'info': sum(1 for i in issues if i.get('severity', '').lower() == 'info')
-        }
-        
-        affected_files = len(set(i.get('file', 'unknown') for i in issues))
-        
-        # Group by rule ID
+        # Severities, files and rules are tallied in one pass
+        counts = Counter()
+        files = set()
         rules = {}
         for issue in issues:
+            counts[issue.get('severity', '').lower()] += 1
+            files.add(issue.get('file', 'unknown'))
+            # Group by rule ID
             rule_id = issue.get('id', 'unknown')
-            if rule_id not in rules:
-                rules[rule_id] = 0
-            rules[rule_id] += 1
+            rules[rule_id] = rules.get(rule_id, 0) + 1
+        severity_counts = {level: counts[level] for level in _SEVERITY_LEVELS}
         
         return {
             'total_violations': len(issues),
             'severity_counts': severity_counts,
-            'affected_files': affected_files,
+            'affected_files': len(files),
             'by_rule': rules,
             'codebase_emissions': results.get('codebase_emissions', 0),
             'scanning_emissions': results.get('scanning_emissions', 0),
@@ -307,22 +373,22 @@ class HTMLReporter:
         # Security: Escape project name for HTML
         safe_project_name = html.escape(project_name)
 
-        # Calculate statistics
-        severity_counts = {
-            'critical': sum(1 for i in issues if i.get('severity', '').lower() == 'critical'),
-            'high': sum(1 for i in issues if i.get('severity', '').lower() == 'high'),
-            'medium': sum(1 for i in issues if i.get('severity', '').lower() == 'medium'),
-            'low': sum(1 for i in issues if i.get('severity', '').lower() == 'low'),
-            'info': sum(1 for i in issues if i.get('severity', '').lower() == 'info')
-        }
-        
-        # Group by file
+        # Calculate statistics and group by file in one pass, keeping each
+        # issue's display severity for the detailed listing
+        counts = Counter()
         by_file = {}
         for issue in issues:
+            if 'severity' in issue:
+                severity = issue['severity'].lower()
+                counts[severity] += 1
+            else:
+                # Listed as info, but left out of the summary counts
+                severity = 'info'
             file_path = issue.get('file', 'unknown')
             if file_path not in by_file:
                 by_file[file_path] = []
-            by_file[file_path].append(issue)
+            by_file[file_path].append((severity, issue))
+        severity_counts = {level: counts[level] for level in _SEVERITY_LEVELS}
         
         # Sort files by violation count
         sorted_files = sorted(by_file.items(), key=lambda x: len(x[1]), reverse=True)
@@ -334,8 +400,11 @@ class HTMLReporter:
         file_labels_json = json.dumps(list(by_file.keys())).replace('<', '\\u003c').replace('>', '\\u003e')
         file_counts_json = json.dumps([len(issues) for issues in by_file.values()])
 
-        # Build HTML content
-        html_content = f"""<!DOCTYPE html>
+        # Stream the report section by section instead of building the whole
+        # document in memory first; it only replaces output_path once complete
+        with _replace_on_success(self.output_path, encoding='utf-8', buffering=1 << 16) as report:
+            write = report.write
+            write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -624,26 +693,25 @@ class HTMLReporter:
             <div class="section">
                 <h2>🔍 Detailed Violations</h2>
                 <div>
-"""
+""")
         
-        # Add file sections with violations
-        for file_path, file_issues in sorted_files:
-            safe_file_path = html.escape(file_path)
-            html_content += f"""
+            # Add file sections with violations
+            for file_path, file_issues in sorted_files:
+                safe_file_path = html.escape(file_path)
+                write(f"""
                 <div class="file-section">
                     <div class="file-name">📄 {safe_file_path}</div>
                     <div style="font-size: 0.9em; color: #666; margin-bottom: 10px;">
                         {len(file_issues)} violation(s)
                     </div>
-"""
+""")
             
-            for issue in sorted(file_issues, key=lambda x: x.get('line', 0)):
-                severity = issue.get('severity', 'info').lower()
-                effort = html.escape(CSVExporter._get_effort(issue))
-                safe_rule_id = html.escape(issue.get('id', 'unknown'))
-                safe_message = html.escape(issue.get('message', 'No message'))
-                safe_line = html.escape(str(issue.get('line', '?')))
-                html_content += f"""
+                for severity, issue in sorted(file_issues, key=lambda row: row[1].get('line', 0)):
+                    effort = html.escape(CSVExporter._get_effort(issue))
+                    safe_rule_id = html.escape(issue.get('id', 'unknown'))
+                    safe_message = html.escape(issue.get('message', 'No message'))
+                    safe_line = html.escape(str(issue.get('line', '?')))
+                    write(f"""
                     <div class="violation-item severity-{severity}">
                         <div class="violation-line">Line {safe_line}</div>
                         <div class="violation-message">
@@ -657,13 +725,13 @@ class HTMLReporter:
                             <span style="background: #f0f0f0; padding: 4px 8px; border-radius: 4px;">{effort}</span>
                         </div>
                     </div>
-"""
+""")
             
-            html_content += """
+                write("""
                 </div>
-"""
+""")
         
-        html_content += f"""
+            write(f"""
                 </div>
             </div>
             
@@ -744,9 +812,6 @@ class HTMLReporter:
     </script>
 </body>
 </html>
-"""
-        
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+""")
         
         return self.output_path
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 import logging
 
+from pydantic_core import to_json
+
 from src.core.domain import Project
 
 logger = logging.getLogger(__name__)
@@ -40,7 +42,7 @@ class ProjectManager:
         """Load projects from registry file"""
         try:
             if self.REGISTRY_FILE.exists():
-                with open(self.REGISTRY_FILE, 'r') as f:
+                with open(self.REGISTRY_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     for project_data in data.get('projects', []):
                         project = Project.from_dict(project_data)
@@ -52,11 +54,13 @@ class ProjectManager:
     def _save_projects(self) -> None:
         """Save projects to registry file"""
         try:
+            # Serialized by pydantic-core straight from the models, without
+            # building the intermediate to_dict() trees
             data = {
-                'projects': [p.to_dict() for p in self.projects.values()]
+                'projects': list(self.projects.values())
             }
-            with open(self.REGISTRY_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.REGISTRY_FILE, 'wb') as f:
+                f.write(to_json(data, indent=2))
             logger.info(f"Saved {len(self.projects)} projects to registry")
         except Exception as e:
             raise ProjectException(f"Error saving projects: {e}")
@@ -279,6 +283,6 @@ class ProjectManager:
                 'exported': datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 'total_projects': len(self.projects)
             },
-            'projects': [p.to_dict() for p in self.projects.values()]
+            'projects': list(self.projects.values())
         }
-        return json.dumps(data, indent=2)
+        return to_json(data, indent=2).decode('utf-8')
@@ -6,13 +6,12 @@ Detects energy inefficiencies and estimates carbon impact.
 """
 
 import os
-import ast
 import sys
 from typing import Optional, Dict, Any, List
 from src.core.rules import RuleRepository
 from src.core.fixer import AISuggester
 from src.core.analyzer import EmissionAnalyzer
-from src.core.detectors import detect_violations
+from src.core.detectors import detect_violations, parse_python
 from src.core.config import ConfigLoader
 from src.core.tracking import create_tracker
 from src.core.calibration import CalibrationAgent
@@ -39,7 +38,7 @@ def scan_file_worker(file_path: str, language: str, config: Dict, rules: List[Di
 
         # Explicitly check for syntax errors
         if language == 'python':
-            ast.parse(content)
+            parse_python(content)
 
         # Scan for violations
         violations = detect_violations(content, file_path, language=language)
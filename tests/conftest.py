@@ -6,9 +6,19 @@ Project objects and other test entities.
 """
 
 import pytest
+from src.core import detectors
+from src.core.detectors import ViolationCache
 from src.core.project_manager import Project
 
 
+@pytest.fixture(autouse=True)
+def isolated_violation_cache(tmp_path, monkeypatch):
+    """Keep each test's analysis cache out of ~/.green-ai and away from other tests."""
+    # Set in the environment so spawned scan workers use it as well
+    monkeypatch.setenv(ViolationCache.ENV_VAR, str(tmp_path / "violations.db"))
+    monkeypatch.setattr(detectors, '_detection_cache', detectors.OrderedDict())
+
+
 @pytest.fixture
 def project_factory():
     """
@@ -0,0 +1,146 @@
+"""
+Tests for the persistent per-file analysis cache.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.core import detectors
+from src.core.detectors import (
+    JavaScriptASTDetector,
+    PythonViolationDetector,
+    ViolationCache,
+    detect_violations,
+    parse_python,
+)
+
+CODE = """
+def read_all(paths):
+    for path in paths:
+        open(path)
+"""
+
+JS_CODE = """
+for (let i = 0; i < 10; i++) { console.log(i); }
+"""
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "violations.db"
+    monkeypatch.setenv(ViolationCache.ENV_VAR, str(db_path))
+    return db_path
+
+
+def _row_count(db_path):
+    with sqlite3.connect(str(db_path)) as conn:
+        return conn.execute('SELECT COUNT(*) FROM violations').fetchone()[0]
+
+
+def test_results_cached_by_content(cache_db, monkeypatch):
+    first = detect_violations(CODE, "a.py")
+    assert _row_count(cache_db) == 1
+
+    # Same content under another path is served from the cache
+    monkeypatch.setattr(detectors, '_detection_cache', detectors.OrderedDict())
+    second = detect_violations(CODE, "moved/b.py")
+    assert second == first
+    assert _row_count(cache_db) == 1
+
+
+def test_cache_miss_on_changed_content(cache_db):
+    detect_violations(CODE, "a.py")
+    detect_violations(CODE + "\nx = 1\n", "a.py")
+    assert _row_count(cache_db) == 2
+
+
+def test_javascript_results_cached_by_content(cache_db, monkeypatch):
+    first = detect_violations(JS_CODE, "a.js", "javascript")
+    assert first
+    assert _row_count(cache_db) == 1
+
+    monkeypatch.setattr(detectors, '_detection_cache', detectors.OrderedDict())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("detectors ran on a cached file")
+
+    monkeypatch.setattr(detectors, '_run_detectors', fail)
+    assert detect_violations(JS_CODE, "b.js", "javascript") == first
+
+
+def test_detectors_do_not_touch_cache(cache_db):
+    # Only detect_violations caches, once per file, not each detector again
+    assert PythonViolationDetector(CODE, "a.py").detect_all()
+    assert JavaScriptASTDetector(JS_CODE, "a.js").detect_all()
+    assert not cache_db.exists()
+
+
+def test_unwritable_cache_does_not_fail_detection(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv(ViolationCache.ENV_VAR, str(blocker / "violations.db"))
+
+    violations = detect_violations(CODE, "a.py")
+    assert any(v['id'] == 'io_in_loop' for v in violations)
+
+
+def test_detect_violations_returns_independent_copies(cache_db):
+    first = detect_violations(CODE, "a.py")
+    first[0]['line'] = -1
+    first.clear()
+
+    # Mutating a result must not leak into later hits for the same content
+    second = detect_violations(CODE, "b.py")
+    assert second
+    assert all(v['line'] > 0 for v in second)
+
+
+def test_syntax_check_parse_reused_by_detector(cache_db, monkeypatch):
+    tree = parse_python(CODE)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("content was parsed twice")
+
+    monkeypatch.setattr('ast.parse', fail)
+    assert parse_python(CODE) is tree
+    violations = PythonViolationDetector(CODE, "a.py").detect_all()
+    assert any(v['id'] == 'io_in_loop' for v in violations)
+
+
+def test_syntax_error_returns_no_violations(cache_db):
+    assert PythonViolationDetector("def broken(:\n", "a.py").detect_all() == []
+    with pytest.raises(SyntaxError):
+        parse_python("def broken(:\n")
+
+
+def test_detect_violations_persists_across_processes(cache_db, monkeypatch):
+    first = detect_violations(CODE, "a.py")
+
+    # A fresh process starts with an empty in-memory cache; the stored result
+    # must be served without running any detector, pattern-based ones included
+    monkeypatch.setattr(detectors, '_detection_cache', detectors.OrderedDict())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("detectors ran on a cached file")
+
+    monkeypatch.setattr(detectors, '_run_detectors', fail)
+    assert detect_violations(CODE, "a.py") == first
+
+
+def test_cache_location_from_environment(cache_db, monkeypatch):
+    assert ViolationCache.db_path() == cache_db
+    detect_violations(CODE, "a.py")
+    assert _row_count(cache_db) == 1
+
+    monkeypatch.delenv(ViolationCache.ENV_VAR)
+    assert ViolationCache.db_path() == ViolationCache.DB_PATH
+
+
+def test_fingerprint_tracks_parser_versions(monkeypatch):
+    assert detectors._detectors_fingerprint() == detectors._DETECTORS_FINGERPRINT
+
+    real_version = detectors.metadata.version
+    monkeypatch.setattr(detectors.metadata, 'version',
+                        lambda dist: 'other' if dist == 'tree-sitter' else real_version(dist))
+    assert detectors._detectors_fingerprint() != detectors._DETECTORS_FINGERPRINT
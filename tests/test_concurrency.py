@@ -36,3 +36,40 @@ def test_scanner_worker_concurrency_error_handling():
         assert 'issues' in results
         # Should have a syntax error issue
         assert any(issue['id'] == 'syntax_error' for issue in results['issues'])
+
+def test_detect_violations_batch_preserves_order():
+    """Batch detection returns one result per file, in input order."""
+    from src.core.detectors import detect_violations, detect_violations_batch
+
+    files = [
+        ('for i in range(len(items)):\n    print(items[i])\n', 'a.py', 'python'),
+        ('x = 1\n', 'b.py', 'python'),
+        ('while True:\n    pass\n', 'c.py', 'python'),
+    ]
+    results = detect_violations_batch(files, workers=2)
+
+    assert len(results) == len(files)
+    for (content, path, language), violations in zip(files, results):
+        assert violations == detect_violations(content, path, language)
+
+def test_analyze_files_by_path(tmp_path):
+    """analyze_files picks the language from the extension and skips unknown files."""
+    from src.core.detectors import analyze_files, detect_violations
+
+    sources = {
+        'a.py': 'while True:\n    pass\n',
+        'b.js': 'while(true) {\n    doSomething();\n}\n',
+        'c.txt': 'while True:\n    pass\n',
+    }
+    paths = []
+    for name, content in sources.items():
+        path = tmp_path / name
+        path.write_text(content)
+        paths.append(str(path))
+
+    results = analyze_files(paths, workers=2)
+
+    assert list(results) == paths
+    assert results[paths[0]] == detect_violations(sources['a.py'], paths[0], 'python')
+    assert results[paths[1]] == detect_violations(sources['b.js'], paths[1], 'javascript')
+    assert results[paths[2]] == []
@@ -5,8 +5,10 @@ Unit tests for export module (CSV and HTML export functionality)
 import pytest
 import os
 import csv
+import json
 import tempfile
-from src.core.export import CSVExporter, HTMLReporter
+from src.core import export
+from src.core.export import CSVExporter, HTMLReporter, JSONExporter
 
 
 class TestCSVExporter:
@@ -329,7 +331,36 @@ class TestHTMLReporter:
             
             assert 'Green-AI Report' in content
             assert '<html' in content.lower()
-    
+
+    def test_html_export_failure_keeps_previous_report(self, sample_results):
+        """A render error part-way through leaves no truncated report behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'test_report.html')
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('previous report')
+            # A non-string message fails while the violation list is written
+            sample_results['issues'][1]['message'] = 42
+
+            with pytest.raises(AttributeError):
+                HTMLReporter(output_path).export(sample_results)
+
+            with open(output_path, 'r', encoding='utf-8') as f:
+                assert f.read() == 'previous report'
+            assert os.listdir(tmpdir) == ['test_report.html']
+
+    def test_html_export_missing_severity_listed_as_info(self, sample_results):
+        """Issues without a severity are shown as info but not counted."""
+        del sample_results['issues'][1]['severity']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'test_report.html')
+            HTMLReporter(output_path).export(sample_results)
+
+            with open(output_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        assert 'violation-item severity-info' in content
+        assert 'data: [1, 0, 0, 0, 0]' in content
+
     def test_get_color_for_severity(self):
         """Test severity color mapping."""
         assert HTMLReporter._get_color_for_severity('critical') == '#ef4444'
@@ -340,5 +371,69 @@ class TestHTMLReporter:
         assert HTMLReporter._get_color_for_severity('unknown') == '#6b7280'
 
 
+
+class TestJSONExporter:
+    """Test JSON export functionality."""
+
+    @pytest.fixture
+    def sample_results(self):
+        """Create sample scan results for testing."""
+        return {
+            'issues': [
+                {
+                    'id': 'io_in_loop',
+                    'line': 45,
+                    'severity': 'critical',
+                    'message': 'File read in loop – café.txt',
+                    'file': 'app.py',
+                    'pattern_match': None
+                }
+            ],
+            'codebase_emissions': 0.000001234,
+            'per_file_emissions': {'app.py': 0.000001}
+        }
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_json_export_round_trips(self, sample_results, monkeypatch, use_orjson):
+        """The file decodes to the same data with or without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr(export, 'orjson', None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.json')
+            JSONExporter(output_path).export(sample_results, project_name='Demo')
+
+            with open(output_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        assert data['issues'] == sample_results['issues']
+        assert data['per_file_emissions'] == {'app.py': 0.000001}
+        assert data['metadata']['project_name'] == 'Demo'
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_json_export_writes_text_unescaped(self, sample_results, monkeypatch, use_orjson):
+        """Non-ASCII text is written as UTF-8 on both encoder paths."""
+        if not use_orjson:
+            monkeypatch.setattr(export, 'orjson', None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.json')
+            JSONExporter(output_path).export(sample_results)
+
+            with open(output_path, 'r', encoding='utf-8') as f:
+                assert 'café.txt' in f.read()
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    @pytest.mark.parametrize('value', [float('nan'), float('inf')])
+    def test_json_export_rejects_non_finite(self, sample_results, monkeypatch, use_orjson, value):
+        """NaN/Infinity emissions fail the same way with or without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr(export, 'orjson', None)
+        sample_results['per_file_emissions']['app.py'] = value
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.json')
+            with pytest.raises(ValueError):
+                JSONExporter(output_path).export(sample_results)
+            assert not os.path.exists(output_path)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
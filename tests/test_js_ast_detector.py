@@ -1,4 +1,9 @@
 import pytest
+from collections import OrderedDict
+
+from tree_sitter import Parser
+
+from src.core import detectors
 from src.core.detectors import JavaScriptASTDetector
 
 def test_excessive_console_logging():
@@ -60,3 +65,71 @@ def test_no_false_positives():
     detector = JavaScriptASTDetector(code, "test.js")
     violations = detector.detect_all()
     assert len(violations) == 0
+
+def test_dom_in_loop_reported_once_per_line():
+    code = """
+    for (const item of items) {
+        list.appendChild(item); list.appendChild(item.clone());
+    }
+    """
+    detector = JavaScriptASTDetector(code, "test.js")
+    violations = detector.detect_all()
+
+    dom_violations = [v for v in violations if v['id'] == 'unnecessary_dom_manipulation']
+    assert len(dom_violations) == 1
+    assert dom_violations[0]['line'] == 3
+
+def test_queries_compiled_once_per_process():
+    code = """
+    for (let i = 0; i < 500; i++) { console.log(i); }
+    """
+    JavaScriptASTDetector(code, "first.js").detect_all()
+    compiled = dict(JavaScriptASTDetector._COMPILED_QUERIES)
+    assert compiled
+
+    JavaScriptASTDetector(code, "second.js").detect_all()
+    # The second file reuses the exact same Query objects
+    assert JavaScriptASTDetector._COMPILED_QUERIES == compiled
+
+def test_edited_file_reparses_incrementally(monkeypatch):
+    parses = []
+
+    class SpyParser:
+        """Records the old tree each parse is given."""
+
+        def __init__(self, language):
+            self._parser = Parser(language)
+
+        def parse(self, source, old_tree=None):
+            parses.append(old_tree)
+            if old_tree is None:
+                return self._parser.parse(source)
+            return self._parser.parse(source, old_tree)
+
+    monkeypatch.setattr(detectors, 'Parser', SpyParser)
+    monkeypatch.setattr(JavaScriptASTDetector, '_TREE_CACHE', OrderedDict())
+
+    before = """
+    function tick() {
+        console.log("tick");
+    }
+    """
+    after = """
+    function tick() {
+        for (let i = 0; i < 500; i++) { list.appendChild(i); }
+        console.log("tick");
+    }
+    """
+    JavaScriptASTDetector(before, "edited.js").detect_all()
+    old_tree = JavaScriptASTDetector._TREE_CACHE["edited.js"][1]
+    edited = JavaScriptASTDetector(after, "edited.js").detect_all()
+
+    # The second parse reused the cached tree, edited to the new source length
+    assert parses == [None, old_tree]
+    assert old_tree.root_node.end_byte == len(after.encode("utf8"))
+
+    # Same findings as a file that was never parsed before
+    fresh = JavaScriptASTDetector(after, "fresh.js").detect_all()
+    assert parses[-1] is None
+    assert edited == fresh
+    assert any(v['id'] == 'unnecessary_dom_manipulation' and v['line'] == 3 for v in edited)
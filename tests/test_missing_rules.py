@@ -112,6 +112,42 @@ let x = 9999 ;
         assert any("varUnused" in m for m in unused_msgs)
         assert not any("varUsed" in m for m in unused_msgs)
 
+    def test_js_unused_variable_lines(self):
+        code = "// header\nconst first = 1;\n\nlet second = 2; console.log(first);\noutlet third = 3;"
+        violations = detect_violations(code, "test.js", "javascript")
+        unused = [(v['line'], v['message']) for v in violations if v['id'] == 'unused_variables']
+        assert unused == [(4, 'Variable "second" appears to be unused.')]
+
+    def test_js_unused_variable_ignores_comments_and_strings(self):
+        code = "// let ghost = 1;\nlet label = 1; console.log('label'); /* label */\nlet shown = 2; f(`${shown}`);"
+        violations = detect_violations(code, "test.js", "javascript")
+        unused = [(v['line'], v['message']) for v in violations if v['id'] == 'unused_variables']
+        assert unused == [(2, 'Variable "label" appears to be unused.')]
+
+    def test_js_unused_variable_sees_template_substitutions(self):
+        code = (
+            "const host = h\nfetch(`http://${host}`)\n"
+            "let files = glob(`${dir}/*.md`); files.sort(); /* x */\n"
+            "const name = n; throw E(`Option '${name}'`)\n"
+            "const key = k; f(`a${ {b: `c${key}`}[d] }e`)\n"
+            "let ghost = 1; f(`${x} ghost`)\n"
+            "const re = /[`\"]/; re.test(s); let tail = 2; f(tail)\n"
+        )
+        violations = detect_violations(code, "test.js", "javascript")
+        unused = [(v['line'], v['message']) for v in violations if v['id'] == 'unused_variables']
+        assert unused == [(6, 'Variable "ghost" appears to be unused.')]
+
+    def test_js_unused_variable_regex_literal_after_declaration(self):
+        code = (
+            "const sep = /,/; use(sep, a / b);\n"
+            "const parts = /a|/.exec(s); if (parts) { x = y / 2 }\n"
+            "const quadcolon=/::\\s*::/.exec(q); f(quadcolon / 2)\n"
+            "let lone = /x/;\n"
+        )
+        violations = detect_violations(code, "test.js", "javascript")
+        unused = [(v['line'], v['message']) for v in violations if v['id'] == 'unused_variables']
+        assert unused == [(4, 'Variable "lone" appears to be unused.')]
+
     def test_js_string_concatenation(self):
         code = "let s = ''; for(let i=0; i<10; i++) { s += 'a'; }"
         violations = detect_violations(code, "test.js", "javascript")
@@ -102,6 +102,20 @@ def complex_function(x):
         # Complexity starts at 1, +11 ifs = 12. Should trigger.
         assert any(v['id'] == 'high_cyclomatic_complexity' for v in violations)
 
+    def test_visit_FunctionDef_complexity_excludes_nested_functions(self):
+        branches = "\n".join(f"        if x == {i}: pass" for i in range(6))
+        code = f"""
+def outer(x):
+    def first(x):
+{branches}
+    def second(x):
+{branches}
+    return first(x) or second(x)
+"""
+        violations = self._get_violations(code)
+        # Each function has complexity 7; the outer one must not count both inner bodies
+        assert not any(v['id'] == 'high_cyclomatic_complexity' for v in violations)
+
     def test_visit_Call_blocking_io(self):
         code = """
 import time
@@ -180,6 +194,39 @@ def spawn_process():
         violations = self._get_violations(code)
         assert any(v['id'] == 'process_spawning' for v in violations)
 
+    def test_visit_Call_os_system_spawning(self):
+        code = """
+import os
+def shell():
+    os.system('ls')
+"""
+        violations = self._get_violations(code)
+        assert any(v['id'] == 'process_spawning' for v in violations)
+
+    def test_visit_Call_aliased_and_wrapped_popen_spawning(self):
+        code = """
+import subprocess as sp
+from subprocess import Popen
+def shell(windows_utils):
+    sp.run(['ls'])
+    windows_utils.Popen(['ls'])
+    Popen(['ls'])
+"""
+        violations = self._get_violations(code)
+        assert [v['line'] for v in violations if v['id'] == 'process_spawning'] == [5, 6, 7]
+
+    def test_visit_Call_popen_lookalike_not_spawning(self):
+        code = """
+import os, subprocess
+def open_it(opener):
+    opener.myPopener()
+    subprocess_helpers.run()
+    os.run()
+    subprocess.system()
+"""
+        violations = self._get_violations(code)
+        assert not any(v['id'] == 'process_spawning' for v in violations)
+
     def test_visit_Call_readlines(self):
         code = """
 def read_lines():
@@ -217,3 +264,15 @@ def log_something(val):
 """
         violations = self._get_violations(code)
         assert any(v['id'] == 'eager_logging_formatting' for v in violations)
+
+    def test_nested_loop_io_reported_once(self):
+        code = """
+def nested_io(paths):
+    for group in paths:
+        for path in group:
+            open(path)
+"""
+        violations = self._get_violations(code)
+        io_violations = [v for v in violations if v['id'] == 'io_in_loop']
+        # Both the outer and inner loop walks reach open(); it must only be reported once
+        assert len(io_violations) == 1
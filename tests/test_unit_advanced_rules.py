@@ -5,7 +5,7 @@ import pytest
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.core.detectors import PythonViolationDetector
+from src.core.detectors import PatternBasedDetector, PythonViolationDetector
 
 class TestAdvancedRules:
     def test_deep_recursion_detection(self):
@@ -80,3 +80,15 @@ def process(items):
                 found = True
                 break
         assert not found, "Efficient lookup (set) incorrectly flagged"
+
+    def test_one_line_loop_reports_each_redundant_call(self):
+        # Once per call kind per line: the second len() adds nothing
+        code = "for item in items: total += len(item) + item.count('a') + len(item)\n"
+        detector = PatternBasedDetector(code, "test_file.py")
+        violations = detector.detect_all()
+
+        messages = [v['message'] for v in violations if v['id'] == 'unnecessary_computation']
+        assert messages == [
+            'Redundant computation detected (len() in loop). Move outside loop.',
+            'Redundant computation detected (.count() in loop). Move outside loop.',
+        ]
@@ -18,6 +18,13 @@ class TestDomainModels:
         assert v.severity == ViolationSeverity.HIGH
         assert v.id == "test_rule"
 
+    def test_violation_is_immutable_and_hashable(self):
+        """Identical findings hash alike, so they can be deduplicated with a set."""
+        v = Violation(id="test_rule", line=10, severity="high", message="Test message")
+        with pytest.raises(ValueError):
+            v.line = 11
+        assert len({v, Violation(**v.model_dump())}) == 1
+
     def test_violation_invalid_severity(self):
         """Test validation error for invalid severity."""
         with pytest.raises(ValueError):
@@ -104,6 +111,48 @@ class TestDomainModels:
         # Low = minor + low + info = 1 + 1 (salvaged) + 1 = 3
         assert p.low_violations == 3
 
+    def test_update_scan_results_keeps_order_when_salvaging(self):
+        """One bad row falls back to per-item validation without reordering."""
+        p = Project(name="Test", repo_url="url")
+
+        p.update_scan_results([
+            {'id': 'v1', 'line': 1, 'severity': 'high', 'message': 'm1'},
+            None,
+            {'id': 'v2', 'line': 2, 'severity': 'blocker', 'message': 'm2'},
+            {'id': 'v3', 'line': 3, 'severity': 'info', 'message': 'm3'},
+        ], emissions=0.0)
+
+        assert [v.id for v in p.violations] == ['v1', 'v2', 'v3']
+        assert p.violations[1].severity == ViolationSeverity.LOW
+        assert p.high_violations == 1
+        assert p.low_violations == 2
+
+    def test_update_scan_results_accepts_violation_objects(self):
+        """Already-validated Violations are kept as-is, not rebuilt."""
+        p = Project(name="Test", repo_url="url")
+        v = Violation(id="v1", line=1, severity="major", message="m1")
+
+        p.update_scan_results([v], emissions=0.0)
+
+        assert p.violations[0] is v
+        assert p.high_violations == 1
+
+    def test_repeat_scan_keeps_violation_details(self):
+        """Rescanning with the same counts reuses the frozen details object."""
+        p = Project(name="Test", repo_url="url")
+        violations_data = [{'id': 'v1', 'line': 1, 'severity': 'medium', 'message': 'm1'}]
+
+        p.update_scan_results(violations_data, emissions=0.0)
+        details = p.violation_details
+        p.update_scan_results(violations_data, emissions=0.0)
+        assert p.violation_details is details
+
+        p.update_scan_results(violations_data * 2, emissions=0.0)
+        assert p.violation_details.medium == 2
+        assert details.medium == 1
+        with pytest.raises(ValueError):
+            details.medium = 3
+
     def test_serialization(self):
         """Test to_dict and from_dict."""
         p = Project(name="Test", repo_url="url")